@@ -3,22 +3,29 @@ import sys
 
 import typer
 
-from lsp_cli.cli import (
-    definition,
-    hover,
-    locate,
-    outline,
-    reference,
-    rename,
-    search,
-    symbol,
-)
+from lsp_cli.cli.lazy import LazyGroup
 from lsp_cli.cli.main import main_callback
-from lsp_cli.cli.shared import get_msg
-from lsp_cli.server import app as server_app
 from lsp_cli.settings import settings
 
+
+class LspGroup(LazyGroup):
+    lazy_commands = {
+        "server": "lsp_cli.server:app",
+        "rename": "lsp_cli.cli.rename:app",
+        "definition": "lsp_cli.cli.definition:app",
+        "hover": "lsp_cli.cli.hover:app",
+        "locate": "lsp_cli.cli.locate:app",
+        "reference": "lsp_cli.cli.reference:app",
+        "outline": "lsp_cli.cli.outline:app",
+        "symbol": "lsp_cli.cli.symbol:app",
+        "search": "lsp_cli.cli.search:app",
+        "batch": "lsp_cli.cli.batch:app",
+        "shell": "lsp_cli.cli.shell:app",
+    }
+
+
 app = typer.Typer(
+    cls=LspGroup,
     help="LSP CLI: A command-line tool for interacting with Language Server Protocol (LSP) features.",
     context_settings={
         "help_option_names": ["-h", "--help"],
@@ -33,17 +40,6 @@ app = typer.Typer(
 # Set callback
 app.callback(invoke_without_command=True)(main_callback)
 
-# Add sub-typers
-app.add_typer(server_app)
-app.add_typer(rename.app)
-app.add_typer(definition.app)
-app.add_typer(hover.app)
-app.add_typer(locate.app)
-app.add_typer(reference.app)
-app.add_typer(outline.app)
-app.add_typer(symbol.app)
-app.add_typer(search.app)
-
 
 def run():
     # Suppress httpx INFO logs in CLI (unless debug mode)
@@ -57,6 +53,8 @@ def run():
     except Exception as e:
         if settings.debug:
             raise e
+        from lsp_cli.cli.shared import get_msg
+
         print(f"Error: {get_msg(e)}", file=sys.stderr)
         sys.exit(1)
 
@@ -0,0 +1,137 @@
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Literal, NamedTuple
+
+import anyio
+import typer
+from lsap.schema.abc import Request
+from lsap.schema.definition import DefinitionRequest
+from lsap.schema.hover import HoverRequest
+from lsap.schema.locate import LocateRequest
+from lsap.schema.reference import ReferenceRequest
+from lsap.schema.symbol import SymbolRequest
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from lsp_cli.client import find_client
+from lsp_cli.manager import BatchRequest, BatchRequestItem, BatchResponse
+from lsp_cli.settings import settings
+from lsp_cli.utils.sync import cli_syncify
+
+from .shared import create_locate, get_msg, managed_client
+
+app = typer.Typer()
+
+type BatchCommand = Literal["definition", "hover", "locate", "reference", "symbol"]
+
+REQUESTS: dict[BatchCommand, type[Request]] = {
+    "definition": DefinitionRequest,
+    "hover": HoverRequest,
+    "locate": LocateRequest,
+    "reference": ReferenceRequest,
+    "symbol": SymbolRequest,
+}
+
+# Commands whose requests take a `mode`
+MODE_COMMANDS: set[BatchCommand] = {"definition", "reference"}
+
+
+class BatchItem(BaseModel):
+    cmd: BatchCommand
+    locate: str
+    mode: str | None = None
+
+
+class PreparedItem(NamedTuple):
+    index: int
+    file_path: Path
+    cmd: BatchCommand
+    req: Request
+
+
+def prepare(index: int, line: str) -> PreparedItem:
+    item = BatchItem.model_validate_json(line)
+    if item.mode is not None and item.cmd not in MODE_COMMANDS:
+        raise ValueError(
+            f"'mode' is only supported for definition and reference, not {item.cmd}"
+        )
+    locate_obj = create_locate(item.locate)
+    file_path = locate_obj.file_path.absolute()
+    if not file_path.exists():
+        raise FileNotFoundError(f"File not found: {file_path}")
+    params: dict[str, Any] = {"locate": locate_obj}
+    if item.mode is not None:
+        params["mode"] = item.mode
+    if item.cmd == "reference":
+        params["context_lines"] = settings.default_context_lines
+        params["max_items"] = settings.default_max_items
+
+    return PreparedItem(
+        index=index,
+        file_path=file_path,
+        cmd=item.cmd,
+        req=REQUESTS[item.cmd].model_validate(params),
+    )
+
+
+def group_key(file_path: Path) -> Path:
+    if target := find_client(file_path):
+        return target.project_path
+    return file_path
+
+
+@app.command("batch")
+@cli_syncify
+async def run_batch():
+    """
+    Run many queries through one request per project.
+
+    Reads NDJSON from stdin, one query per line, e.g.
+    `{"cmd": "hover", "locate": "foo.py@bar"}`. Supported commands are
+    definition, hover, locate, reference and symbol; definition and
+    reference also take an optional `mode`. Writes one NDJSON line per
+    query, in input order, holding either `result` or `error`.
+    """
+    results: list[dict[str, Any]] = []
+    groups: defaultdict[Path, list[PreparedItem]] = defaultdict(list)
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        index = len(results)
+        results.append({"result": None})
+        try:
+            item = prepare(index, line)
+            groups[group_key(item.file_path)].append(item)
+        except Exception as e:
+            results[index] = {"error": get_msg(e)}
+
+    async def run_group(items: list[PreparedItem]) -> None:
+        req = BatchRequest(
+            [
+                BatchRequestItem(kind=item.cmd, req=item.req.model_dump(mode="json"))
+                for item in items
+            ]
+        )
+        try:
+            async with managed_client(items[0].file_path) as client:
+                resp = await client.post("/capability/batch", BatchResponse, json=req)
+        except Exception as e:
+            msg = get_msg(e)
+            for item in items:
+                results[item.index] = {"error": msg}
+            return
+
+        assert resp is not None
+        for item, item_resp in zip(items, resp.root, strict=True):
+            if item_resp.error is not None:
+                results[item.index] = {"error": item_resp.error}
+            else:
+                results[item.index] = {"result": item_resp.result}
+
+    async with anyio.create_task_group() as tg:
+        for items in groups.values():
+            tg.start_soon(run_group, items)
+
+    sys.stdout.buffer.writelines(to_json(result) + b"\n" for result in results)
@@ -6,7 +6,7 @@ from lsap.schema.definition import DefinitionRequest, DefinitionResponse
 from lsp_cli.utils.sync import cli_syncify
 
 from . import options as op
-from .shared import create_locate, managed_client, print_resp
+from .shared import create_locate, run_query
 
 app = typer.Typer()
 
@@ -40,17 +40,13 @@ async def get_definition(
 
     locate_obj = create_locate(locate)
 
-    async with managed_client(locate_obj.file_path) as client:
-        resp_obj = await client.post(
-            "/capability/definition",
-            DefinitionResponse,
-            json=DefinitionRequest(
-                locate=locate_obj,
-                mode=mode,
-            ),
-        )
-
-    if resp_obj:
-        print_resp(resp_obj)
-    else:
-        print(f"Warning: No {mode.replace('_', ' ')} found")
+    # Definitions usually live in other files, so they cannot be cached per
+    # file version
+    await run_query(
+        locate_obj.file_path,
+        "/capability/definition",
+        DefinitionResponse,
+        DefinitionRequest(locate=locate_obj, mode=mode),
+        not_found=mode.replace("_", " "),
+        cached=False,
+    )
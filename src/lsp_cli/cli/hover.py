@@ -4,7 +4,7 @@ from lsap.schema.hover import HoverRequest, HoverResponse
 from lsp_cli.utils.sync import cli_syncify
 
 from . import options as op
-from .shared import create_locate, managed_client, print_resp
+from .shared import create_locate, run_query
 
 app = typer.Typer()
 
@@ -19,12 +19,13 @@ async def get_hover(
     """
     locate_obj = create_locate(locate)
 
-    async with managed_client(locate_obj.file_path) as client:
-        resp_obj = await client.post(
-            "/capability/hover", HoverResponse, json=HoverRequest(locate=locate_obj)
-        )
-
-    if resp_obj:
-        print_resp(resp_obj)
-    else:
-        print("Warning: No hover information found")
+    # Hover text of imported symbols comes from other files, so it cannot be
+    # cached per file version
+    await run_query(
+        locate_obj.file_path,
+        "/capability/hover",
+        HoverResponse,
+        HoverRequest(locate=locate_obj),
+        not_found="hover information",
+        cached=False,
+    )
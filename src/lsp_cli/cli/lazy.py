@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import importlib
+from typing import ClassVar
+
+import click
+import typer
+from typer.core import TyperGroup
+
+
+class LazyGroup(TyperGroup):
+    """Typer group that imports sub-command modules only when they are used.
+
+    `lazy_commands` maps a command name to the `"module:attr"` import path of
+    the `typer.Typer` app providing it. Running `lsp hover` then imports only
+    `lsp_cli.cli.hover` instead of every command module and their schemas.
+    """
+
+    lazy_commands: ClassVar[dict[str, str]] = {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        commands = super().list_commands(ctx)
+        return [
+            *(name for name in commands if name not in self.lazy_commands),
+            *self.lazy_commands,
+        ]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd := super().get_command(ctx, cmd_name):
+            return cmd
+        if import_path := self.lazy_commands.get(cmd_name):
+            cmd = self._load(cmd_name, import_path)
+            if cmd is not None:
+                # Register the converted command so later lookups in this
+                # process skip the import and the Typer -> Click conversion.
+                self.add_command(cmd, cmd_name)
+            return cmd
+        return None
+
+    def _load(self, cmd_name: str, import_path: str) -> click.Command | None:
+        module_name, attr = import_path.split(":")
+        sub_app: typer.Typer = getattr(importlib.import_module(module_name), attr)
+
+        # Build through a parent app so the command is converted exactly as
+        # `add_typer` on the root app would have done it.
+        parent = typer.Typer(rich_markup_mode=self.rich_markup_mode)
+        parent.add_typer(sub_app)
+        return typer.main.get_group(parent).commands.get(cmd_name)
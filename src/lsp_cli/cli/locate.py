@@ -5,7 +5,7 @@ from lsap.schema.locate import LocateRequest, LocateResponse
 
 from lsp_cli.utils.sync import cli_syncify
 
-from .shared import create_locate, managed_client, print_resp
+from .shared import cached_request, create_locate, print_resp
 
 app = typer.Typer()
 
@@ -50,10 +50,12 @@ async def get_location(
     """
     locate_obj = create_locate(locate)
 
-    async with managed_client(locate_obj.file_path) as client:
-        resp_obj = await client.post(
-            "/capability/locate", LocateResponse, json=LocateRequest(locate=locate_obj)
-        )
+    resp_obj = await cached_request(
+        locate_obj.file_path,
+        "/capability/locate",
+        LocateResponse,
+        LocateRequest(locate=locate_obj),
+    )
 
     if resp_obj:
         print_resp(resp_obj)
@@ -12,9 +12,19 @@ def main_callback(
         "-d",
         help="Enable verbose debug logging for troubleshooting.",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help=(
+            "Bypass cached clients and always ask the manager to create one, "
+            "and skip the on-disk response cache."
+        ),
+    ),
 ):
     if debug:
         settings.debug = True
+    if no_cache:
+        settings.no_cache = True
 
     logger.remove()
     logger.add(sys.stderr, level=settings.effective_log_level)
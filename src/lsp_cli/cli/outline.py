@@ -1,16 +1,30 @@
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Final
 
 import typer
 from lsap.schema.models import SymbolKind
-from lsap.schema.outline import OutlineRequest, OutlineResponse
+from lsap.schema.outline import OutlineResponse
 
+from lsp_cli.manager import FilteredOutlineRequest
 from lsp_cli.utils.sync import cli_syncify
 
-from .shared import managed_client, print_resp
+from .shared import cached_request, print_resp
 
 app = typer.Typer()
 
+_OUTLINE_MAJOR_KINDS: Final[frozenset[SymbolKind]] = frozenset(
+    {
+        SymbolKind.Class,
+        SymbolKind.Function,
+        SymbolKind.Method,
+        SymbolKind.Interface,
+        SymbolKind.Enum,
+        SymbolKind.Module,
+        SymbolKind.Namespace,
+        SymbolKind.Struct,
+    }
+)
+
 
 @app.command("outline")
 @cli_syncify
@@ -31,34 +45,19 @@ async def get_outline(
     """
     Get the hierarchical symbol outline (classes, functions, etc.) for a specific file.
     """
-    async with managed_client(file_path) as client:
-        resp_obj = await client.post(
-            "/capability/outline",
-            OutlineResponse,
-            json=OutlineRequest(file_path=file_path),
-        )
+    resp_obj = await cached_request(
+        file_path,
+        "/capability/outline",
+        OutlineResponse,
+        FilteredOutlineRequest(
+            file_path=file_path,
+            kinds=None if all_symbols else _OUTLINE_MAJOR_KINDS,
+        ),
+    )
 
     if resp_obj and resp_obj.items:
-        if not all_symbols:
-            filtered_items = [
-                item
-                for item in resp_obj.items
-                if item.kind
-                in {
-                    SymbolKind.Class,
-                    SymbolKind.Function,
-                    SymbolKind.Method,
-                    SymbolKind.Interface,
-                    SymbolKind.Enum,
-                    SymbolKind.Module,
-                    SymbolKind.Namespace,
-                    SymbolKind.Struct,
-                }
-            ]
-            resp_obj.items = filtered_items
-            if not filtered_items:
-                print("Warning: No symbols found (use --all to show local variables)")
-                return
         print_resp(resp_obj)
+    elif not all_symbols:
+        print("Warning: No symbols found (use --all to show local variables)")
     else:
         print("Warning: No symbols found")
@@ -7,7 +7,7 @@ from lsp_cli.settings import settings
 from lsp_cli.utils.sync import cli_syncify
 
 from . import options as op
-from .shared import create_locate, managed_client, print_resp
+from .shared import create_locate, run_query
 
 app = typer.Typer()
 
@@ -52,27 +52,23 @@ async def get_reference(
 
     locate_obj = create_locate(locate)
 
-    async with managed_client(locate_obj.file_path) as client:
-        effective_context_lines = (
-            context_lines
-            if context_lines is not None
-            else settings.default_context_lines
-        )
+    effective_context_lines = (
+        context_lines if context_lines is not None else settings.default_context_lines
+    )
 
-        resp_obj = await client.post(
-            "/capability/reference",
-            ReferenceResponse,
-            json=ReferenceRequest(
-                locate=locate_obj,
-                mode=mode,
-                context_lines=effective_context_lines,
-                max_items=max_items,
-                start_index=start_index,
-                pagination_id=pagination_id,
-            ),
-        )
-
-    if resp_obj:
-        print_resp(resp_obj)
-    else:
-        print(f"Warning: No {mode} found")
+    # References span other files, so they cannot be cached per file version
+    await run_query(
+        locate_obj.file_path,
+        "/capability/reference",
+        ReferenceResponse,
+        ReferenceRequest(
+            locate=locate_obj,
+            mode=mode,
+            context_lines=effective_context_lines,
+            max_items=max_items,
+            start_index=start_index,
+            pagination_id=pagination_id,
+        ),
+        not_found=mode,
+        cached=False,
+    )
@@ -9,6 +9,7 @@ from lsap.schema.rename import (
     RenamePreviewResponse,
 )
 
+from lsp_cli.manager import RenameApplyRequest
 from lsp_cli.utils.sync import cli_syncify
 
 from . import options as op
@@ -42,19 +43,22 @@ async def rename_preview(
             print("Warning: No rename possibilities found at the location")
 
 
+ExcludeOpt = Annotated[
+    list[str] | None,
+    typer.Option(
+        "--exclude",
+        help="File paths or glob patterns to exclude from the rename operation. Can be specified multiple times.",
+    ),
+]
+
+
 @app.command("execute")
 @cli_syncify
 async def rename_execute(
     rename_id: Annotated[
         str, typer.Argument(help="Rename ID from a previous preview.")
     ],
-    exclude: Annotated[
-        list[str] | None,
-        typer.Option(
-            "--exclude",
-            help="File paths or glob patterns to exclude from the rename operation. Can be specified multiple times.",
-        ),
-    ] = None,
+    exclude: ExcludeOpt = None,
     workspace: op.WorkspaceOpt = None,
 ):
     """
@@ -77,3 +81,32 @@ async def rename_execute(
             print_resp(resp_obj)
         else:
             raise RuntimeError("Failed to execute rename")
+
+
+@app.command("apply")
+@cli_syncify
+async def rename_apply(
+    new_name: Annotated[str, typer.Argument(help="The new name for the symbol.")],
+    locate: op.LocateOpt,
+    exclude: ExcludeOpt = None,
+):
+    """
+    Rename a symbol at a specific location directly, without a separate preview step.
+    """
+    locate_obj = create_locate(locate)
+
+    async with managed_client(locate_obj.file_path) as client:
+        resp_obj = await client.post(
+            "/capability/rename/apply",
+            RenameExecuteResponse,
+            json=RenameApplyRequest(
+                locate=locate_obj,
+                new_name=new_name,
+                exclude_files=exclude or [],
+            ),
+        )
+
+        if resp_obj:
+            print_resp(resp_obj)
+        else:
+            raise RuntimeError("Failed to apply rename")
@@ -13,6 +13,20 @@ from .shared import managed_client, print_resp
 
 app = typer.Typer()
 
+_KIND_BY_NAME: dict[str, SymbolKind] = {
+    **{kind.name.lower(): kind for kind in SymbolKind},
+    **{kind.value: kind for kind in SymbolKind},
+}
+
+
+def parse_kinds(kinds: list[str]) -> list[SymbolKind]:
+    try:
+        return [_KIND_BY_NAME[k.lower()] for k in kinds]
+    except KeyError as e:
+        raise typer.BadParameter(
+            f"Unknown symbol kind: {e.args[0]!r}", param_hint="'--kind'"
+        ) from None
+
 
 @app.command("search")
 @cli_syncify
@@ -39,6 +53,7 @@ async def search(
     """
     if workspace is None:
         workspace = Path.cwd()
+    symbol_kinds = parse_kinds(kinds) if kinds else None
 
     async with managed_client(workspace) as client:
         effective_max_items = (
@@ -50,7 +65,7 @@ async def search(
             SearchResponse,
             json=SearchRequest(
                 query=query,
-                kinds=[SymbolKind(k) for k in kinds] if kinds else None,
+                kinds=symbol_kinds,
                 max_items=effective_max_items,
                 start_index=start_index,
                 pagination_id=pagination_id,
@@ -1,47 +1,165 @@
+import atexit
+import functools
+import os
 import re
-from collections.abc import AsyncGenerator
+import sys
+from collections.abc import AsyncGenerator, Callable
 from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Any, TextIO
 
 import httpx
+from asyncer import asyncify
+from lsap.schema.abc import Response, get_template
 from lsap.schema.locate import LineScope, Locate
 from lsap.utils.locate import parse_locate_string
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
-from lsp_cli.manager import CreateClientRequest, CreateClientResponse
-from lsp_cli.server import get_manager_client
-from lsp_cli.utils.http import AsyncHttpClient
+from lsp_cli.manager import (
+    CreateClientRequest,
+    CreateClientResponse,
+    LookupClientRequest,
+    LookupClientResponse,
+    get_manager_client,
+)
+from lsp_cli.settings import CACHE_DIR, settings
+from lsp_cli.utils.http import AsyncHttpClient, HttpClient
+from lsp_cli.utils.response_cache import ResponseCache, response_cache_key
 from lsp_cli.utils.socket import wait_socket
+from lsp_cli.utils.sync import get_runner
+
+capability_clients: dict[Path, AsyncHttpClient] = {}
+
+response_cache = ResponseCache(
+    CACHE_DIR / "responses.sqlite", max_entries=settings.response_cache_size
+)
 
 
 def clean_error_msg(msg: str) -> str:
     return re.sub(r"\[Errno \d+\] ", "", msg)
 
 
-@asynccontextmanager
-async def managed_client(path: Path) -> AsyncGenerator[AsyncHttpClient]:
-    path = path.absolute()
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {path}")
+def lookup_client(client: HttpClient, path: Path) -> LookupClientResponse | None:
+    """Return the already running client for `path`, or `None` on a miss."""
+    try:
+        return client.get(
+            "/lookup",
+            LookupClientResponse,
+            params=LookupClientRequest(path=path),
+        )
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            return None
+        raise
+
 
-    with get_manager_client() as client:
+def connect_client(path: Path) -> LookupClientResponse | CreateClientResponse:
+    """Ask the manager for the client serving `path`, starting one if needed."""
+    client = get_manager_client()
+    info = None if settings.no_cache else lookup_client(client, path)
+    if info is None:
         info = client.post(
             "/create",
             CreateClientResponse,
             json=CreateClientRequest(path=path),
         )
-        assert info is not None
+    assert info is not None
+    return info
 
-    uds_path = info.uds_path
+
+@asynccontextmanager
+async def managed_client(path: Path) -> AsyncGenerator[AsyncHttpClient]:
+    path = path.absolute()
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {path}")
+
+    # The manager client is synchronous; run the handshake in a worker thread
+    # so concurrent callers (e.g. `lsp batch` over several projects) overlap.
+    info = await asyncify(connect_client)(path)
+    if isinstance(info, CreateClientResponse) and info.created:
+        # A new server, whose socket replaced the one a cached client used
+        await evict_capability_client(info.uds_path)
+
+    client = await get_capability_client(info.uds_path)
+    try:
+        yield client
+    except httpx.ConnectError:
+        await evict_capability_client(info.uds_path)
+        raise
+
+
+async def get_capability_client(uds_path: Path) -> AsyncHttpClient:
+    """Return the process-wide client for the capability server at `uds_path`,
+    so repeated requests to it reuse one keep-alive connection."""
+    # Checked even for a cached client, as a long-lived process (`lsp shell`)
+    # can outlive the server, e.g. after it was stopped or timed out
     await wait_socket(uds_path, timeout=10.0)
+    if client := capability_clients.get(uds_path):
+        return client
 
     transport = httpx.AsyncHTTPTransport(uds=uds_path.as_posix())
-    async with AsyncHttpClient(
+    client = AsyncHttpClient(
         httpx.AsyncClient(transport=transport, base_url="http://localhost")
-    ) as client:
-        yield client
+    )
+    capability_clients[uds_path] = client
+    # Runs before the shared runner is closed, as atexit hooks are LIFO
+    atexit.register(lambda: get_runner().run(client.close()))
+    return client
+
+
+async def evict_capability_client(uds_path: Path) -> None:
+    """Close and forget the cached client for `uds_path`, if any."""
+    if client := capability_clients.pop(uds_path, None):
+        await client.close()
 
 
+async def cached_request[T: BaseModel](
+    file_path: Path, url: str, resp_schema: type[T], req: BaseModel
+) -> T | None:
+    """POST `req` to the client for `file_path`, reusing the cached response
+    while `file_path` is unchanged."""
+    file_path = file_path.absolute()
+    key = (
+        None
+        if settings.no_cache
+        else response_cache_key(file_path, url, req.model_dump_json())
+    )
+    if key and (cached := response_cache.get(key, resp_schema)):
+        return cached
+
+    resp = await send_request(file_path, url, resp_schema, req)
+    if key and resp:
+        response_cache.put(key, resp)
+    return resp
+
+
+async def send_request[T: BaseModel](
+    file_path: Path, url: str, resp_schema: type[T], req: BaseModel
+) -> T | None:
+    """POST `req` to the client for `file_path`, bypassing the response cache."""
+    async with managed_client(file_path) as client:
+        return await client.post(url, resp_schema, json=req)
+
+
+async def run_query(
+    file_path: Path,
+    url: str,
+    resp_schema: type[Response],
+    req: BaseModel,
+    *,
+    not_found: str,
+    cached: bool = True,
+) -> None:
+    """Send `req` for `file_path` and print the response, or a warning naming
+    `not_found` if there is none."""
+    send = cached_request if cached else send_request
+    if resp := await send(file_path, url, resp_schema, req):
+        print_resp(resp)
+    else:
+        print(f"Warning: No {not_found} found")
+
+
+@functools.lru_cache(maxsize=64)
 def create_locate(locate_str: str) -> Locate:
     locate = parse_locate_string(locate_str)
     if isinstance(locate.scope, LineScope):
@@ -58,35 +176,87 @@ def create_locate(locate_str: str) -> Locate:
     return locate
 
 
-def print_resp(resp):
-    print(resp.format())
+def write_resp(resp: Response, out: TextIO) -> None:
+    """Render `resp` directly into `out`, without building the whole text."""
+    match resp.model_config.get("json_schema_extra"):
+        case {"markdown": str() as source}:
+            template = get_template(source)
+            context = template.context_class(
+                template, globals=template.make_globals(resp.model_dump())
+            )
+            template.render_with_context(context, out)
+        case _:
+            out.write(resp.format())
+
+
+def print_resp(resp: Response) -> None:
+    try:
+        write_resp(resp, sys.stdout)
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`), stop rendering and keep the
+        # interpreter from failing again when it flushes stdout at exit.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
 
 
 def get_msg(err: Exception | ExceptionGroup) -> str:
-    match err:
-        case ExceptionGroup():
-            return "\n".join(get_msg(se) for se in err.exceptions)
-        case ValidationError():
-            msgs = []
-            for e in err.errors():
-                m = str(e["msg"])
-                if m.startswith("Value error, "):
-                    m = m[len("Value error, ") :]
-                msgs.append(m)
-            return "\n".join(msgs)
-        case httpx.HTTPStatusError():
-            data = err.response.json()
-            if isinstance(data, dict) and "detail" in data:
-                return clean_error_msg(str(data["detail"]))
-            return clean_error_msg(str(err))
-        case ValueError():
-            msg = str(err)
-            if "invalid literal for int()" in msg:
-                return f"Invalid line number or range in locate string: {msg.split(': ')[-1]}"
-            return msg
-        case OSError() as e:
-            if e.strerror and e.filename:
-                return f"{e.strerror}: {e.filename}"
-            return clean_error_msg(str(e))
-        case _:
-            return str(err)
+    """Describe `err`, flattening nested exception groups into one message per
+    line and dropping adjacent duplicates."""
+    msgs: list[str] = []
+    stack: list[BaseException] = [err]
+    while stack:
+        e = stack.pop()
+        if isinstance(e, BaseExceptionGroup):
+            stack.extend(reversed(e.exceptions))
+        elif (msg := get_single_msg(e)) and (not msgs or msgs[-1] != msg):
+            msgs.append(msg)
+    return "\n".join(msgs)
+
+
+def _validation_msg(err: ValidationError) -> str:
+    msgs = []
+    for e in err.errors():
+        m = str(e["msg"])
+        if m.startswith("Value error, "):
+            m = m[len("Value error, ") :]
+        msgs.append(m)
+    return "\n".join(msgs)
+
+
+def _http_status_msg(err: httpx.HTTPStatusError) -> str:
+    data = err.response.json()
+    if isinstance(data, dict) and "detail" in data:
+        return clean_error_msg(str(data["detail"]))
+    return clean_error_msg(str(err))
+
+
+def _value_msg(err: ValueError) -> str:
+    msg = str(err)
+    if "invalid literal for int()" in msg:
+        return f"Invalid line number or range in locate string: {msg.split(': ')[-1]}"
+    return msg
+
+
+def _os_msg(err: OSError) -> str:
+    if err.strerror and err.filename:
+        return f"{err.strerror}: {err.filename}"
+    return clean_error_msg(str(err))
+
+
+_MSG_HANDLERS: dict[type, Callable[[Any], str]] = {
+    ValidationError: _validation_msg,
+    httpx.HTTPStatusError: _http_status_msg,
+    ValueError: _value_msg,
+    OSError: _os_msg,
+}
+
+
+def get_single_msg(err: BaseException) -> str:
+    # Walk the MRO so subclasses use the most specific handler, e.g.
+    # `ValidationError` (a `ValueError`) is not formatted as a plain one.
+    for cls in type(err).__mro__:
+        if handler := _MSG_HANDLERS.get(cls):
+            return handler(err)
+    return str(err)
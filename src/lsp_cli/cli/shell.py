@@ -0,0 +1,72 @@
+import shlex
+import sys
+from typing import Annotated
+
+import click
+import typer
+
+from .shared import get_msg
+
+app = typer.Typer()
+
+
+def run_line(root: click.Group, ctx: click.Context, line: str) -> int:
+    """Run one command line and return its exit code."""
+    args = shlex.split(line)
+    if not args:
+        return 0
+
+    name, *rest = args
+    cmd = root.get_command(ctx, name)
+    if cmd is None or name == "shell":
+        raise click.UsageError(f"No such command: {name!r}")
+    rv = cmd.main(
+        rest, prog_name=f"{ctx.find_root().info_name} {name}", standalone_mode=False
+    )
+    # Without standalone mode, `typer.Exit` is returned as its exit code
+    return rv if isinstance(rv, int) else 0
+
+
+@app.command("shell")
+def run_shell(
+    ctx: typer.Context,
+    marker: Annotated[
+        str | None,
+        typer.Option(
+            "--marker",
+            help="After each command, print this marker and the command's exit code on a line of their own, to both stdout and stderr.",
+        ),
+    ] = None,
+):
+    """
+    Run commands read from stdin, one per line, in a single process.
+
+    Each line is a regular command without the leading `lsp`, e.g.
+    `hover -L foo.py@bar`. The process keeps its connections to the manager and
+    language servers open between lines, so a series of queries skips the
+    per-invocation startup. Errors are reported on stderr and do not end the
+    session. With `--marker`, a driving process can tell where the output of
+    each command ends and whether it failed.
+    """
+    root = ctx.find_root().command
+    assert isinstance(root, click.Group)
+
+    for line in sys.stdin:
+        code = 1
+        try:
+            code = run_line(root, ctx, line)
+        except click.exceptions.Exit as e:
+            code = e.exit_code
+        except click.Abort:
+            pass
+        except click.ClickException as e:
+            print(f"Error: {e.format_message()}", file=sys.stderr)
+            code = e.exit_code
+        except Exception as e:
+            print(f"Error: {get_msg(e)}", file=sys.stderr)
+
+        if marker is not None:
+            print(f"{marker} {code}")
+            print(f"{marker} {code}", file=sys.stderr)
+        sys.stdout.flush()
+        sys.stderr.flush()
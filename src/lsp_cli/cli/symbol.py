@@ -4,7 +4,7 @@ from lsap.schema.symbol import SymbolRequest, SymbolResponse
 from lsp_cli.utils.sync import cli_syncify
 
 from . import options as op
-from .shared import create_locate, managed_client, print_resp
+from .shared import create_locate, run_query
 
 app = typer.Typer()
 
@@ -19,14 +19,10 @@ async def get_symbol(
     """
     locate_obj = create_locate(locate)
 
-    async with managed_client(locate_obj.file_path) as client:
-        resp_obj = await client.post(
-            "/capability/symbol",
-            SymbolResponse,
-            json=SymbolRequest(locate=locate_obj),
-        )
-
-    if resp_obj:
-        print_resp(resp_obj)
-    else:
-        print("Warning: No symbol information found")
+    await run_query(
+        locate_obj.file_path,
+        "/capability/symbol",
+        SymbolResponse,
+        SymbolRequest(locate=locate_obj),
+        not_found="symbol information",
+    )
@@ -1,8 +1,20 @@
+import json
+import os
+import threading
+import time
+from functools import cache
 from pathlib import Path
 from typing import NamedTuple
 
 from lsp_client.client import Client
-from lsp_client.clients.lang import lang_clients
+from lsp_client.clients.lang import Language, lang_clients
+from lsp_client.protocol.lang import LanguageConfig
+
+from lsp_cli.settings import CACHE_DIR, settings
+
+ROOTS_CACHE_PATH = CACHE_DIR / "roots.json"
+
+_roots_lock = threading.Lock()
 
 
 class TargetClient(NamedTuple):
@@ -10,10 +22,165 @@ class TargetClient(NamedTuple):
     client_cls: type[Client]
 
 
+class CachedRoot(NamedTuple):
+    project_path: str
+    lang: Language
+    timestamp: float
+
+
+@cache
+def language_config(client_cls: type[Client]) -> LanguageConfig:
+    """The (immutable) language config of `client_cls`, built once."""
+    return client_cls.get_language_config()
+
+
+@cache
+def supported_languages() -> tuple[str, ...]:
+    return tuple(
+        sorted(
+            {
+                language_config(client_cls).kind.value
+                for client_cls in lang_clients.values()
+            }
+        )
+    )
+
+
+@cache
+def load_roots() -> dict[str, CachedRoot]:
+    """Project roots found by this or earlier processes, keyed by path."""
+    try:
+        data = json.loads(ROOTS_CACHE_PATH.read_text())
+        return {key: CachedRoot(*value) for key, value in data.items()}
+    except (OSError, ValueError, TypeError):
+        return {}
+
+
+def save_roots(roots: dict[str, CachedRoot]) -> None:
+    try:
+        ROOTS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = ROOTS_CACHE_PATH.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(roots))
+        tmp_path.replace(ROOTS_CACHE_PATH)
+    except OSError:
+        pass
+
+
+def list_markers(dir_path: Path, markers: set[str]) -> set[str]:
+    """Return which of `markers` exist in `dir_path`, with a single scan."""
+    try:
+        with os.scandir(dir_path) as entries:
+            return {entry.name for entry in entries if entry.name in markers}
+    except OSError:
+        # Not listable (e.g. execute-only), fall back to probing each marker
+        return {marker for marker in markers if (dir_path / marker).exists()}
+
+
+def search_client(
+    dir_path: Path, langs: tuple[Language, ...]
+) -> tuple[Language, TargetClient] | None:
+    """Find the project root of the first language in `langs` that has one.
+
+    Walks up from `dir_path` once, checking the markers of all candidate
+    languages per directory, instead of walking the tree once per language.
+    """
+    configs: dict[Language, LanguageConfig] = {
+        lang: language_config(lang_clients[lang]) for lang in langs
+    }
+    markers = {
+        marker
+        for config in configs.values()
+        for marker in (*config.project_files, *config.exclude_files)
+    }
+    roots: dict[Language, Path | None] = {}
+
+    for path in (dir_path, *dir_path.parents):
+        found = list_markers(path, markers)
+        for lang, config in configs.items():
+            if lang in roots:
+                continue
+            if any(excl in found for excl in config.exclude_files):
+                roots[lang] = None
+            elif any(proj in found for proj in config.project_files):
+                roots[lang] = path
+
+        # Languages earlier in `langs` take precedence, so a root can only be
+        # returned once every language before it is known to have none.
+        for lang in langs:
+            if lang not in roots:
+                break
+            if (root := roots[lang]) is not None:
+                return lang, TargetClient(
+                    project_path=root, client_cls=lang_clients[lang]
+                )
+
+    for lang in langs:
+        if (root := roots.get(lang)) is not None:
+            return lang, TargetClient(project_path=root, client_cls=lang_clients[lang])
+    return None
+
+
+def search_scope(path: Path) -> tuple[Path, tuple[Language, ...]]:
+    """Directory to search from and the languages that may handle `path`."""
+    if not path.is_file():
+        return path, tuple(lang_clients)
+    return path.parent, tuple(
+        lang
+        for lang, client_cls in lang_clients.items()
+        if any(
+            path.name.endswith(suffix)
+            for suffix in language_config(client_cls).suffixes
+        )
+    )
+
+
+def _find_client(path: Path) -> TargetClient | None:
+    dir_path, langs = search_scope(path.absolute())
+    if not langs:
+        return None
+
+    key = f"{dir_path.as_posix()}:{','.join(langs)}"
+    roots = load_roots()
+    now = time.time()
+
+    if (cached := roots.get(key)) and now - cached.timestamp < settings.root_cache_ttl:
+        if client_cls := lang_clients.get(cached.lang):
+            return TargetClient(Path(cached.project_path), client_cls)
+
+    found = search_client(dir_path, langs)
+    if found is None:
+        return None
+
+    lang, target = found
+    roots[key] = CachedRoot(target.project_path.as_posix(), lang, now)
+    for stale in [
+        k for k, v in roots.items() if now - v.timestamp >= settings.root_cache_ttl
+    ]:
+        del roots[stale]
+    save_roots(roots)
+    return target
+
+
 def find_client(path: Path) -> TargetClient | None:
-    candidates = lang_clients.values()
+    """Find the language client and project root for `path`.
+
+    Lookups are keyed by directory and candidate languages, so all files of
+    one kind in a directory share an entry. Results are memoized in memory and
+    in `ROOTS_CACHE_PATH` for `settings.root_cache_ttl` seconds, so repeated
+    lookups skip walking the directory tree for project markers.
+
+    Safe to call from several threads at once, e.g. from the manager's
+    worker threads.
+    """
+    with _roots_lock:
+        return _find_client(path)
+
 
-    for client_cls in candidates:
-        lang_config = client_cls.get_language_config()
-        if root := lang_config.find_project_root(path):
-            return TargetClient(project_path=root, client_cls=client_cls)
+def clear_client_cache() -> None:
+    """Forget all cached project roots, e.g. after markers were added."""
+    with _roots_lock:
+        load_roots().clear()
+        try:
+            ROOTS_CACHE_PATH.unlink(missing_ok=True)
+        except OSError:
+            pass
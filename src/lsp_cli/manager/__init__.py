@@ -1,25 +1,47 @@
 from __future__ import annotations
 
+import fcntl
+import os
+import select
 import subprocess
 import sys
+import threading
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
-from lsp_cli.settings import MANAGER_UDS_PATH
+from lsp_cli.settings import MANAGER_LOCK_PATH, MANAGER_UDS_PATH
 from lsp_cli.utils.http import HttpClient
 from lsp_cli.utils.socket import is_socket_alive
 
-from .manager import Manager, get_manager, manager_lifespan
 from .models import (
+    BatchRequest,
+    BatchRequestItem,
+    BatchResponse,
+    BatchResponseItem,
     CreateClientRequest,
     CreateClientResponse,
     DeleteClientRequest,
     DeleteClientResponse,
+    FilteredOutlineRequest,
+    LookupClientRequest,
+    LookupClientResponse,
     ManagedClientInfo,
     ManagedClientInfoList,
+    RenameApplyRequest,
 )
 
+if TYPE_CHECKING:
+    from .manager import Manager, get_manager, manager_lifespan
+
 __all__ = [
+    "BatchRequest",
+    "BatchRequestItem",
+    "BatchResponse",
+    "BatchResponseItem",
     "Manager",
     "ManagedClientInfo",
     "ManagedClientInfoList",
@@ -27,25 +49,106 @@ __all__ = [
     "CreateClientResponse",
     "DeleteClientRequest",
     "DeleteClientResponse",
+    "FilteredOutlineRequest",
+    "LookupClientRequest",
+    "LookupClientResponse",
+    "READY_FD_ENV",
+    "RenameApplyRequest",
     "connect_manager",
+    "get_manager_client",
     "get_manager",
     "manager_lifespan",
+    "manager_lock",
 ]
 
 
-def connect_manager() -> HttpClient:
-    if not is_socket_alive(MANAGER_UDS_PATH):
+# Names the pipe a newly spawned manager writes to once it is listening
+READY_FD_ENV = "LSP_READY_FD"
+MANAGER_START_TIMEOUT = 10.0
+
+
+@contextmanager
+def manager_lock() -> Iterator[None]:
+    """Hold the lock that serializes starting managers across processes.
+
+    Without it, concurrent first commands (e.g. of pytest-xdist workers) each
+    spawn a manager, and every one that binds unlinks the socket of the one
+    before, leaving it running orphaned with its language servers.
+    """
+    MANAGER_LOCK_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with MANAGER_LOCK_PATH.open("a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        yield
+
+
+def spawn_manager() -> None:
+    """Start the manager and wait until its socket is listening.
+
+    The manager reports readiness on a pipe, so this wakes up right away
+    instead of the first request polling the socket with connect retries. If
+    the manager exits early, the pipe is closed and this returns at once.
+    """
+    read_fd, write_fd = os.pipe()
+    try:
         subprocess.Popen(
             (sys.executable, "-m", "lsp_cli.manager"),
             stdin=subprocess.DEVNULL,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
             start_new_session=True,
+            pass_fds=(write_fd,),
+            env={**os.environ, READY_FD_ENV: str(write_fd)},
         )
+    finally:
+        os.close(write_fd)
+    try:
+        select.select([read_fd], [], [], MANAGER_START_TIMEOUT)
+    finally:
+        os.close(read_fd)
+
+
+def connect_manager() -> HttpClient:
+    if not is_socket_alive(MANAGER_UDS_PATH):
+        # Held until the new manager listens, so that waiting callers find it
+        # running instead of spawning their own
+        with manager_lock():
+            if not is_socket_alive(MANAGER_UDS_PATH):
+                spawn_manager()
 
     return HttpClient(
         httpx.Client(
-            transport=httpx.HTTPTransport(uds=str(MANAGER_UDS_PATH), retries=5),
+            transport=httpx.HTTPTransport(
+                uds=str(MANAGER_UDS_PATH),
+                retries=5,
+                # A CLI process talks to the manager over a single connection
+                limits=httpx.Limits(max_keepalive_connections=1, keepalive_expiry=30.0),
+            ),
             base_url="http://localhost",
         )
     )
+
+
+_manager_client: HttpClient | None = None
+_manager_client_lock = threading.Lock()
+
+
+def get_manager_client() -> HttpClient:
+    """Return the process-wide manager client, reusing its UDS connection."""
+    global _manager_client
+    # Concurrent first calls (e.g. from worker threads) must neither spawn the
+    # manager twice nor open a second connection pool.
+    with _manager_client_lock:
+        if _manager_client is None:
+            _manager_client = connect_manager()
+            weakref.finalize(_manager_client, _manager_client.close)
+        return _manager_client
+
+
+def __getattr__(name: str) -> Any:
+    # The manager server pulls in litestar and the LSP clients; only import it
+    # when it is actually used, not when the CLI needs the request models.
+    if name in ("Manager", "get_manager", "manager_lifespan"):
+        from . import manager
+
+        return getattr(manager, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,56 @@
+import os
+import socket
+from contextlib import nullcontext
+
 import uvicorn
 
 from lsp_cli.settings import MANAGER_UDS_PATH
+from lsp_cli.utils.socket import is_socket_alive
 
+from . import READY_FD_ENV, manager_lock
 from .manager import app
 
+
+def bind_socket() -> socket.socket | None:
+    """Listen on the manager socket before the app starts, so that clients
+    can connect (and have their requests queued) from that moment on.
+
+    Returns `None` if another manager is already listening.
+    """
+    # `connect_manager` holds the lock while it waits for the manager it
+    # spawned, so only a manager started some other way takes it here
+    spawned = READY_FD_ENV in os.environ
+    with nullcontext() if spawned else manager_lock():
+        if is_socket_alive(MANAGER_UDS_PATH):
+            return None
+        MANAGER_UDS_PATH.unlink(missing_ok=True)
+        MANAGER_UDS_PATH.parent.mkdir(parents=True, exist_ok=True)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.bind(str(MANAGER_UDS_PATH))
+        MANAGER_UDS_PATH.chmod(0o666)
+        sock.listen(2048)
+        return sock
+
+
+def notify_ready() -> None:
+    """Tell the process that spawned us, if any, that the socket is listening."""
+    fd = os.environ.pop(READY_FD_ENV, None)
+    if fd is None:
+        return
+    try:
+        with os.fdopen(int(fd), "wb") as pipe:
+            pipe.write(b"ready\n")
+    except (OSError, ValueError):
+        pass
+
+
 if __name__ == "__main__":
-    MANAGER_UDS_PATH.unlink(missing_ok=True)
-    MANAGER_UDS_PATH.parent.mkdir(parents=True, exist_ok=True)
-    uvicorn.run(app, uds=str(MANAGER_UDS_PATH))
+    sock = bind_socket()
+    notify_ready()
+    if sock is None:
+        raise SystemExit("Manager is already running")
+    server = uvicorn.Server(uvicorn.Config(app, access_log=False))
+    try:
+        server.run(sockets=[sock])
+    finally:
+        MANAGER_UDS_PATH.unlink(missing_ok=True)
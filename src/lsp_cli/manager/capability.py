@@ -1,32 +1,77 @@
-from typing import Self
+from typing import Self, cast, override
 
-from attrs import frozen
-from litestar import Controller, post
+import asyncer
+from attrs import define, frozen
+from litestar import Controller, Response, post
 from litestar.datastructures.state import State
 from lsap.capability.definition import (
     DefinitionCapability,
     DefinitionRequest,
-    DefinitionResponse,
 )
-from lsap.capability.hover import HoverCapability, HoverRequest, HoverResponse
-from lsap.capability.locate import LocateCapability, LocateRequest, LocateResponse
+from lsap.capability.hover import HoverCapability, HoverRequest
+from lsap.capability.locate import LocateCapability, LocateRequest
 from lsap.capability.outline import OutlineCapability, OutlineRequest, OutlineResponse
 from lsap.capability.reference import (
     ReferenceCapability,
     ReferenceRequest,
-    ReferenceResponse,
 )
 from lsap.capability.rename import (
     RenameExecuteCapability,
     RenameExecuteRequest,
-    RenameExecuteResponse,
     RenamePreviewCapability,
     RenamePreviewRequest,
-    RenamePreviewResponse,
 )
-from lsap.capability.search import SearchCapability, SearchRequest, SearchResponse
-from lsap.capability.symbol import SymbolCapability, SymbolRequest, SymbolResponse
+from lsap.capability.search import SearchCapability, SearchRequest
+from lsap.capability.symbol import SymbolCapability, SymbolRequest
+from lsap.schema.abc import Request
+from lsap.schema.models import SymbolKind
+from lsap.utils.capability import ensure_capability
+from lsap.utils.symbol import iter_symbols
 from lsp_client import Client
+from lsp_client.capability.request import WithRequestDocumentSymbol
+
+from .encoding import decode_body, json_response
+from .models import (
+    BatchKind,
+    BatchRequest,
+    BatchRequestItem,
+    BatchResponse,
+    BatchResponseItem,
+    FilteredOutlineRequest,
+    RenameApplyRequest,
+)
+
+BATCH_REQUESTS: dict[BatchKind, type[Request]] = {
+    "definition": DefinitionRequest,
+    "hover": HoverRequest,
+    "locate": LocateRequest,
+    "outline": FilteredOutlineRequest,
+    "reference": ReferenceRequest,
+    "search": SearchRequest,
+    "symbol": SymbolRequest,
+}
+
+
+@define
+class FilteredOutlineCapability(OutlineCapability):
+    @override
+    async def __call__(self, req: OutlineRequest) -> OutlineResponse | None:
+        symbols = await ensure_capability(
+            self.client, WithRequestDocumentSymbol
+        ).request_document_symbol_list(req.file_path)
+        if symbols is None:
+            return None
+
+        symbols_with_path = iter_symbols(symbols)
+        if isinstance(req, FilteredOutlineRequest) and (kinds := req.kinds) is not None:
+            symbols_with_path = (
+                (path, symbol)
+                for path, symbol in symbols_with_path
+                if SymbolKind.from_lsp(symbol.kind) in kinds
+            )
+
+        items = await self.resolve_symbols(req.file_path, symbols_with_path)
+        return OutlineResponse(file_path=req.file_path, items=items)
 
 
 @frozen
@@ -34,7 +79,7 @@ class Capabilities:
     definition: DefinitionCapability
     hover: HoverCapability
     locate: LocateCapability
-    outline: OutlineCapability
+    outline: FilteredOutlineCapability
     reference: ReferenceCapability
     rename_preview: RenamePreviewCapability
     rename_execute: RenameExecuteCapability
@@ -47,7 +92,7 @@ class Capabilities:
             definition=DefinitionCapability(client),
             hover=HoverCapability(client),
             locate=LocateCapability(client),
-            outline=OutlineCapability(client),
+            outline=FilteredOutlineCapability(client),
             reference=ReferenceCapability(client),
             rename_preview=RenamePreviewCapability(client),
             rename_execute=RenameExecuteCapability(client),
@@ -56,51 +101,90 @@ class Capabilities:
         )
 
 
+def get_capabilities(state: State) -> Capabilities:
+    return cast(Capabilities, state.capabilities)
+
+
 class CapabilityController(Controller):
     path = "/capability"
 
+    @post("/batch")
+    async def batch(self, body: bytes, state: State) -> Response[bytes]:
+        """Run several read-only capability requests concurrently in one call."""
+        data = decode_body(body, BatchRequest)
+        capabilities = get_capabilities(state)
+        results = [BatchResponseItem() for _ in data.root]
+
+        async def run(index: int, item: BatchRequestItem) -> None:
+            try:
+                req = BATCH_REQUESTS[item.kind].model_validate(item.req)
+                capability = getattr(capabilities, item.kind)
+                results[index] = BatchResponseItem(result=await capability(req))
+            except Exception as e:
+                results[index] = BatchResponseItem(error=str(e))
+
+        async with asyncer.create_task_group() as tg:
+            for index, item in enumerate(data.root):
+                tg.soonify(run)(index, item)
+
+        return json_response(BatchResponse(results))
+
     @post("/definition")
-    async def definition(
-        self, data: DefinitionRequest, state: State
-    ) -> DefinitionResponse | None:
-        return await state.capabilities.definition(data)
+    async def definition(self, body: bytes, state: State) -> Response[bytes]:
+        data = decode_body(body, DefinitionRequest)
+        return json_response(await get_capabilities(state).definition(data))
 
     @post("/hover")
-    async def hover(self, data: HoverRequest, state: State) -> HoverResponse | None:
-        return await state.capabilities.hover(data)
+    async def hover(self, body: bytes, state: State) -> Response[bytes]:
+        data = decode_body(body, HoverRequest)
+        return json_response(await get_capabilities(state).hover(data))
 
     @post("/locate")
-    async def locate(self, data: LocateRequest, state: State) -> LocateResponse | None:
-        return await state.capabilities.locate(data)
+    async def locate(self, body: bytes, state: State) -> Response[bytes]:
+        data = decode_body(body, LocateRequest)
+        return json_response(await get_capabilities(state).locate(data))
 
     @post("/outline")
-    async def outline(
-        self, data: OutlineRequest, state: State
-    ) -> OutlineResponse | None:
-        return await state.capabilities.outline(data)
+    async def outline(self, body: bytes, state: State) -> Response[bytes]:
+        data = decode_body(body, FilteredOutlineRequest)
+        return json_response(await get_capabilities(state).outline(data))
 
     @post("/reference")
-    async def reference(
-        self, data: ReferenceRequest, state: State
-    ) -> ReferenceResponse | None:
-        return await state.capabilities.reference(data)
+    async def reference(self, body: bytes, state: State) -> Response[bytes]:
+        data = decode_body(body, ReferenceRequest)
+        return json_response(await get_capabilities(state).reference(data))
 
     @post("/rename/preview")
-    async def rename_preview(
-        self, data: RenamePreviewRequest, state: State
-    ) -> RenamePreviewResponse | None:
-        return await state.capabilities.rename_preview(data)
+    async def rename_preview(self, body: bytes, state: State) -> Response[bytes]:
+        data = decode_body(body, RenamePreviewRequest)
+        return json_response(await get_capabilities(state).rename_preview(data))
 
     @post("/rename/execute")
-    async def rename_execute(
-        self, data: RenameExecuteRequest, state: State
-    ) -> RenameExecuteResponse | None:
-        return await state.capabilities.rename_execute(data)
+    async def rename_execute(self, body: bytes, state: State) -> Response[bytes]:
+        data = decode_body(body, RenameExecuteRequest)
+        return json_response(await get_capabilities(state).rename_execute(data))
+
+    @post("/rename/apply")
+    async def rename_apply(self, body: bytes, state: State) -> Response[bytes]:
+        data = decode_body(body, RenameApplyRequest)
+        capabilities = get_capabilities(state)
+        preview = await capabilities.rename_preview(data)
+        if preview is None:
+            return json_response(None)
+        return json_response(
+            await capabilities.rename_execute(
+                RenameExecuteRequest(
+                    rename_id=preview.rename_id, exclude_files=data.exclude_files
+                )
+            )
+        )
 
     @post("/search")
-    async def search(self, data: SearchRequest, state: State) -> SearchResponse | None:
-        return await state.capabilities.search(data)
+    async def search(self, body: bytes, state: State) -> Response[bytes]:
+        data = decode_body(body, SearchRequest)
+        return json_response(await get_capabilities(state).search(data))
 
     @post("/symbol")
-    async def symbol(self, data: SymbolRequest, state: State) -> SymbolResponse | None:
-        return await state.capabilities.symbol(data)
+    async def symbol(self, body: bytes, state: State) -> Response[bytes]:
+        data = decode_body(body, SymbolRequest)
+        return json_response(await get_capabilities(state).symbol(data))
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from functools import cache
 from pathlib import Path
 
 import anyio
@@ -13,27 +14,38 @@ from attrs import define, field
 from litestar import Litestar
 from loguru import logger as global_logger
 
-from lsp_cli.client import TargetClient
-from lsp_cli.manager.capability import CapabilityController, Capabilities
+from lsp_cli.client import TargetClient, language_config
 from lsp_cli.settings import LOG_DIR, RUNTIME_DIR, settings
 
 from .models import ManagedClientInfo
 
 
+@cache
 def get_client_id(target: TargetClient) -> str:
-    kind = target.client_cls.get_language_config().kind
-    path_hash = xxhash.xxh32_hexdigest(target.project_path.as_posix())
+    kind = language_config(target.client_cls).kind
+    path_hash = xxhash.xxh3_64_hexdigest(target.project_path.as_posix().encode())
     return f"{kind.value}-{path_hash}-default"
 
 
+def prepare_socket_path(path: Path) -> None:
+    """Create the socket directory and remove a stale socket, in one worker
+    thread hop instead of one per filesystem call."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)
+
+
 @define
 class ManagedClient:
     target: TargetClient
 
+    _id: str = field(init=False)
+    _uds_path: Path = field(init=False)
     _server: uvicorn.Server = field(init=False)
     _timeout_scope: anyio.CancelScope = field(init=False)
     _server_scope: anyio.CancelScope = field(init=False)
 
+    _stopped: anyio.Event = field(init=False)
+
     _deadline: float = field(init=False)
     _should_exit: bool = False
 
@@ -41,50 +53,65 @@ class ManagedClient:
     _logger_sink_id: int = field(init=False)
 
     def __attrs_post_init__(self) -> None:
+        self._id = get_client_id(self.target)
+        self._uds_path = RUNTIME_DIR / f"{self._id}.sock"
         self._deadline = anyio.current_time() + settings.idle_timeout
+        # Created up front so `stop` works even before the client is serving,
+        # e.g. when a stop request follows the create request immediately.
+        self._server_scope = anyio.CancelScope()
+        self._timeout_scope = anyio.CancelScope()
+        self._stopped = anyio.Event()
 
         client_log_dir = LOG_DIR / "clients"
         client_log_dir.mkdir(parents=True, exist_ok=True)
 
         log_path = client_log_dir / f"{self.id}.log"
         log_level = settings.effective_log_level
+        client_id = self._id
+        # Only records bound to (or logged within the context of) this client.
+        # Written inline rather than via `enqueue`, which would start one
+        # writer thread per client.
         self._logger_sink_id = global_logger.add(
             log_path,
             rotation="10 MB",
             retention="1 day",
             level=log_level,
-            format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | <cyan>{name}:{function}:{line}</cyan> - <level>{message}</level>",
-            enqueue=True,
+            format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}",
+            filter=lambda record: record["extra"].get("client_id") == client_id,
         )
         self._logger = global_logger.bind(client_id=self.id)
         self._logger.info("Client log initialized at {}", log_path)
 
     @property
     def id(self) -> str:
-        return get_client_id(self.target)
+        return self._id
 
     @property
     def uds_path(self) -> Path:
-        return RUNTIME_DIR / f"{self.id}.sock"
+        return self._uds_path
 
     @property
     def info(self) -> ManagedClientInfo:
         return ManagedClientInfo(
             project_path=self.target.project_path,
-            language=self.target.client_cls.get_language_config().kind.value,
+            language=language_config(self.target.client_cls).kind.value,
             remaining_time=max(0.0, self._deadline - anyio.current_time()),
         )
 
     def stop(self) -> None:
         self._logger.info("Stopping managed client")
         self._should_exit = True
-        self._server.should_exit = True
         self._server_scope.cancel()
         self._timeout_scope.cancel()
 
+    async def wait_stopped(self) -> None:
+        """Wait until `run` has returned and the socket is removed."""
+        await self._stopped.wait()
+
     def _reset_timeout(self) -> None:
+        # Only move the deadline; the timeout loop notices it when its current
+        # sleep ends, so requests never have to wake it up.
         self._deadline = anyio.current_time() + settings.idle_timeout
-        self._timeout_scope.cancel()
 
     async def _timeout_loop(self) -> None:
         while not self._should_exit:
@@ -103,6 +130,10 @@ class ManagedClient:
     async def _serve(self) -> None:
         from litestar import Request, Response
 
+        # The capability stack pulls in most of lsap, import it only once a
+        # client is actually served rather than at manager startup.
+        from .capability import CapabilityController, Capabilities
+
         @asynccontextmanager
         async def lifespan(app: Litestar) -> AsyncGenerator[None]:
             async with self.target.client_cls(
@@ -126,17 +157,19 @@ class ManagedClient:
             exception_handlers={Exception: exception_handler},
         )
 
+        # The server runs on the manager's event loop (uvloop when installed,
+        # see the `uvicorn.Server` started by `__main__`), so no loop is
+        # configured here.
         config = uvicorn.Config(
             app,
             uds=str(self.uds_path),
-            loop="asyncio",
             log_config=None,  # Disable default uvicorn logging
+            access_log=False,
         )
         self._server = uvicorn.Server(config)
 
         async with asyncer.create_task_group() as tg:
-            with anyio.CancelScope() as scope:
-                self._server_scope = scope
+            with self._server_scope:
                 tg.soonify(self._timeout_loop)()
                 await self._server.serve()
 
@@ -148,14 +181,16 @@ class ManagedClient:
         )
 
         uds_path = anyio.Path(self.uds_path)
-        await uds_path.unlink(missing_ok=True)
-        await uds_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            await self._serve()
+            await asyncer.asyncify(prepare_socket_path)(self.uds_path)
+            # Tag library log records emitted while serving with this client
+            with global_logger.contextualize(client_id=self.id):
+                await self._serve()
         finally:
             self._logger.info("Cleaning up client")
             await uds_path.unlink(missing_ok=True)
             self._logger.remove(self._logger_sink_id)
             self._timeout_scope.cancel()
             self._server_scope.cancel()
+            self._stopped.set()
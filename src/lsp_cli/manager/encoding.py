@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from litestar import MediaType, Response
+from litestar.exceptions import ValidationException
+from pydantic import BaseModel, ValidationError
+
+
+def decode_body[T: BaseModel](body: bytes, schema: type[T]) -> T:
+    """Validate the raw request body in a single pydantic pass, instead of
+    letting litestar decode it to builtins and validate those again."""
+    try:
+        return schema.model_validate_json(body)
+    except ValidationError as e:
+        detail = "\n".join(
+            f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors()
+        )
+        raise ValidationException(detail=detail) from e
+
+
+def json_response(resp: BaseModel | None, status_code: int = 201) -> Response[bytes]:
+    """Encode `resp` with pydantic's JSON serializer directly, instead of
+    letting litestar dump it to a dict and encode that again."""
+    content = b"null" if resp is None else resp.model_dump_json().encode()
+    return Response(content, media_type=MediaType.JSON, status_code=status_code)
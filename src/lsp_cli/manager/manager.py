@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+import os
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from pathlib import Path
@@ -8,28 +10,56 @@ from typing import Final, cast
 import anyio
 import asyncer
 from attrs import Factory, define, field
-from litestar import Litestar, delete, get, post
+from litestar import Litestar, Response, delete, get, post
 from litestar.datastructures import State
 from litestar.di import Provide
 from litestar.exceptions import NotFoundException
 from loguru import logger
 
-from lsp_cli.client import find_client
-from lsp_cli.settings import LOG_DIR, settings
+from lsp_cli.client import TargetClient, find_client
+from lsp_cli.settings import CACHE_DIR, LOG_DIR, settings
 
 from .client import ManagedClient, get_client_id
+from .encoding import decode_body, json_response
 from .models import (
     CreateClientRequest,
     CreateClientResponse,
     DeleteClientRequest,
     DeleteClientResponse,
+    LookupClientResponse,
     ManagedClientInfo,
 )
 
+RECENT_PATH = CACHE_DIR / "recent.json"
+RESOLVE_CACHE_SIZE = 512
+# How long deleting clients waits for them to exit, below the CLI's request
+# timeout so that a slow shutdown still gets a response
+STOP_WAIT_TIMEOUT = 3.0
+
+
+def load_recent() -> list[Path]:
+    """Paths whose clients were started most recently, newest first."""
+    try:
+        return [Path(path) for path in json.loads(RECENT_PATH.read_text())]
+    except (OSError, ValueError, TypeError):
+        return []
+
+
+def save_recent(paths: list[Path]) -> None:
+    try:
+        RECENT_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = RECENT_PATH.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps([path.as_posix() for path in paths]))
+        tmp_path.replace(RECENT_PATH)
+    except OSError:
+        pass
+
 
 @define
 class Manager:
     _clients: dict[str, ManagedClient] = Factory(dict)
+    _resolved: dict[Path, tuple[TargetClient, str]] = Factory(dict)
+    _recent_lock: anyio.Lock = Factory(anyio.Lock)
     _tg: asyncer.TaskGroup = field(init=False)
     _logger_sink_id: int = field(init=False)
 
@@ -49,24 +79,78 @@ class Manager:
             f"[Manager] Manager log initialized at {log_path} (level: {log_level})"
         )
 
-    async def create_client(self, path: Path) -> Path:
-        target = find_client(path)
-        if not target:
+    async def _resolve(self, path: Path) -> tuple[TargetClient, str] | None:
+        """Find the target and client id for `path`, memoized while the client
+        serving it is running."""
+        if resolved := self._resolved.get(path):
+            # Entries of paths without a running client (e.g. lookup misses)
+            # are never invalidated by a stopping client, resolve them again
+            if resolved[1] in self._clients:
+                return resolved
+            del self._resolved[path]
+        # Searching for project markers stats the filesystem, keep it off the
+        # event loop.
+        if not (target := await asyncer.asyncify(find_client)(path)):
+            return None
+
+        if len(self._resolved) >= RESOLVE_CACHE_SIZE:
+            del self._resolved[next(iter(self._resolved))]
+        resolved = self._resolved[path] = (target, get_client_id(target))
+        return resolved
+
+    async def create_client(self, path: Path) -> tuple[ManagedClient, bool]:
+        """Return the client for `path` and whether it was just created."""
+        resolved = await self._resolve(path)
+        if not resolved:
             raise NotFoundException(f"No LSP client found for path: {path}")
 
+        target, client_id = resolved
         logger.debug(f"[Manager] Found client target: {target}")
 
-        client_id = get_client_id(target)
-        if client_id not in self._clients:
-            logger.info(f"[Manager] Creating new client: {client_id}")
-            m_client = ManagedClient(target)
-            self._clients[client_id] = m_client
-            self._tg.soonify(self._run_client)(m_client)
-        else:
+        # No await between the lookup and the insert below, so concurrent
+        # requests for the same project always share a single client.
+        if m_client := self._clients.get(client_id):
             logger.info(f"[Manager] Reusing existing client: {client_id}")
-            self._clients[client_id]._reset_timeout()
-
-        return self._clients[client_id].uds_path
+            m_client._reset_timeout()
+            return m_client, False
+
+        logger.info(f"[Manager] Creating new client: {client_id}")
+        m_client = ManagedClient(target)
+        self._clients[client_id] = m_client
+        self._tg.soonify(self._run_client)(m_client)
+        await self._remember(path.absolute())
+        return m_client, True
+
+    async def _remember(self, path: Path) -> None:
+        if settings.prewarm_clients <= 0:
+            return
+        # The file is read and written off the event loop, the lock keeps
+        # concurrent creations from overwriting each other's update
+        async with self._recent_lock:
+            loaded = await asyncer.asyncify(load_recent)()
+            recent = [path, *(p for p in loaded if p != path)]
+            await asyncer.asyncify(save_recent)(recent[: settings.prewarm_clients])
+
+    async def prewarm(self) -> None:
+        """Start clients for the most recently used projects in the
+        background, so their first query skips the language server startup."""
+        # Oldest first, so re-remembering each path keeps the order intact
+        for path in reversed(load_recent()[: settings.prewarm_clients]):
+            if not path.exists():
+                continue
+            try:
+                await self.create_client(path)
+            except NotFoundException:
+                continue
+
+    async def lookup_client(self, path: Path) -> ManagedClient | None:
+        if resolved := await self._resolve(path):
+            _, client_id = resolved
+            if client := self._clients.get(client_id):
+                logger.info(f"[Manager] Found existing client: {client_id}")
+                client._reset_timeout()
+                return client
+        return None
 
     @logger.catch(level="ERROR")
     async def _run_client(self, client: ManagedClient) -> None:
@@ -76,17 +160,41 @@ class Manager:
         finally:
             logger.info(f"[Manager] Removing client: {client.id}")
             self._clients.pop(client.id, None)
+            # Resolve again next time, in case project markers have changed
+            for path in [
+                p for p, (_, cid) in self._resolved.items() if cid == client.id
+            ]:
+                del self._resolved[path]
 
     async def delete_client(self, path: Path):
-        if target := find_client(path):
-            client_id = get_client_id(target)
+        if resolved := await self._resolve(path):
+            _, client_id = resolved
             if client := self._clients.get(client_id):
                 logger.info(f"[Manager] Stopping client: {client_id}")
                 client.stop()
-
-    def inspect_client(self, path: Path) -> ManagedClientInfo | None:
-        if target := find_client(path):
-            client_id = get_client_id(target)
+                # Only report success once the client is gone, so that a new
+                # client for the same project never reuses the exiting one.
+                with anyio.move_on_after(STOP_WAIT_TIMEOUT) as scope:
+                    await client.wait_stopped()
+                if scope.cancelled_caught:
+                    logger.warning(f"[Manager] Client still stopping: {client_id}")
+
+    async def delete_all_clients(self) -> list[ManagedClientInfo]:
+        clients = list(self._clients.values())
+        infos = [client.info for client in clients]
+        for client in clients:
+            logger.info(f"[Manager] Stopping client: {client.id}")
+            client.stop()
+        with anyio.move_on_after(STOP_WAIT_TIMEOUT) as scope:
+            for client in clients:
+                await client.wait_stopped()
+        if scope.cancelled_caught:
+            logger.warning("[Manager] Some clients are still stopping")
+        return infos
+
+    async def inspect_client(self, path: Path) -> ManagedClientInfo | None:
+        if resolved := await self._resolve(path):
+            _, client_id = resolved
             if client := self._clients.get(client_id):
                 return client.info
         return None
@@ -100,6 +208,8 @@ class Manager:
         try:
             async with asyncer.create_task_group() as tg:
                 self._tg = tg
+                if settings.prewarm_clients > 0:
+                    tg.soonify(self.prewarm)()
                 yield self
         finally:
             logger.info("[Manager] Shutting down manager")
@@ -127,16 +237,28 @@ logger.add(
 
 
 @post("/create", status_code=201)
-async def create_client_handler(
-    data: CreateClientRequest, state: State
-) -> CreateClientResponse:
+async def create_client_handler(body: bytes, state: State) -> Response[bytes]:
+    data = decode_body(body, CreateClientRequest)
+    manager = get_manager(state)
+    client, created = await manager.create_client(data.path)
+    return json_response(
+        CreateClientResponse(
+            uds_path=client.uds_path, info=client.info, created=created
+        )
+    )
+
+
+@get("/lookup")
+async def lookup_client_handler(path: Path, state: State) -> Response[bytes]:
     manager = get_manager(state)
-    uds_path = await manager.create_client(data.path)
-    info = manager.inspect_client(data.path)
-    if not info:
-        raise RuntimeError("Failed to create client")
+    client = await manager.lookup_client(path)
+    if not client:
+        raise NotFoundException(f"No running client for path: {path}")
 
-    return CreateClientResponse(uds_path=uds_path, info=info)
+    return json_response(
+        LookupClientResponse(uds_path=client.uds_path, info=client.info),
+        status_code=200,
+    )
 
 
 @delete("/delete", status_code=200)
@@ -144,12 +266,18 @@ async def delete_client_handler(
     data: DeleteClientRequest, state: State
 ) -> DeleteClientResponse:
     manager = get_manager(state)
-    info = manager.inspect_client(data.path)
+    info = await manager.inspect_client(data.path)
     await manager.delete_client(data.path)
 
     return DeleteClientResponse(info=info)
 
 
+@delete("/delete/all", status_code=200)
+async def delete_all_clients_handler(state: State) -> list[ManagedClientInfo]:
+    manager = get_manager(state)
+    return await manager.delete_all_clients()
+
+
 @get("/list")
 async def list_clients_handler(state: State) -> list[ManagedClientInfo]:
     manager = get_manager(state)
@@ -159,7 +287,9 @@ async def list_clients_handler(state: State) -> list[ManagedClientInfo]:
 app: Final = Litestar(
     route_handlers=[
         create_client_handler,
+        lookup_client_handler,
         delete_client_handler,
+        delete_all_clients_handler,
         list_clients_handler,
     ],
     dependencies={"manager": Provide(get_manager, sync_to_thread=False)},
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any, Literal
 
-from lsp_client.jsonrpc.types import RawNotification, RawRequest, RawResponsePackage
-from pydantic import BaseModel, RootModel
+from lsap.schema.models import SymbolKind
+from lsap.schema.outline import OutlineRequest
+from lsap.schema.rename import RenameExecuteRequest, RenamePreviewRequest
+from pydantic import BaseModel, Field, RootModel, field_serializer, field_validator
 
 
 class ManagedClientInfo(BaseModel):
@@ -14,12 +17,10 @@ class ManagedClientInfo(BaseModel):
     @classmethod
     def format(cls, data: list[ManagedClientInfo] | ManagedClientInfo) -> str:
         infos = [data] if isinstance(data, ManagedClientInfo) else data
-        lines = []
-        for info in infos:
-            lines.append(
-                f"{info.language:<10} {info.project_path} ({info.remaining_time:.1f}s)"
-            )
-        return "\n".join(lines)
+        return "\n".join(
+            f"{info.language:<10} {info.project_path} ({info.remaining_time:.1f}s)"
+            for info in infos
+        )
 
 
 class ManagedClientInfoList(RootModel[list[ManagedClientInfo]]):
@@ -33,6 +34,17 @@ class CreateClientRequest(BaseModel):
 class CreateClientResponse(BaseModel):
     uds_path: Path
     info: ManagedClientInfo
+    # Whether the manager started a new client rather than reusing one
+    created: bool = False
+
+
+class LookupClientRequest(BaseModel):
+    path: Path
+
+
+class LookupClientResponse(BaseModel):
+    uds_path: Path
+    info: ManagedClientInfo
 
 
 class DeleteClientRequest(BaseModel):
@@ -43,13 +55,53 @@ class DeleteClientResponse(BaseModel):
     info: ManagedClientInfo | None
 
 
-class LspRequest(BaseModel):
-    payload: RawRequest
+class FilteredOutlineRequest(OutlineRequest):
+    """Outline request that only resolves symbols of the given kinds.
+
+    Filtering happens before hover information is fetched, so skipped symbols
+    cost neither LSP round-trips nor payload.
+    """
+
+    kinds: frozenset[SymbolKind] | None = None
 
+    @field_serializer("kinds")
+    def serialize_kinds(self, kinds: frozenset[SymbolKind] | None) -> list[str] | None:
+        # Sorted, so equal requests serialize to equal (cacheable) JSON
+        return None if kinds is None else sorted(kinds)
 
-class LspResponse(BaseModel):
-    payload: RawResponsePackage
 
+class RenameApplyRequest(RenamePreviewRequest):
+    """Rename request that is previewed and executed in a single call."""
+
+    exclude_files: list[str] = Field(
+        default_factory=list,
+        description="List of file paths or glob patterns to exclude from the rename operation",
+    )
+
+    @field_validator("exclude_files")
+    @classmethod
+    def validate_patterns(cls, v: list[str]) -> list[str]:
+        return RenameExecuteRequest.validate_patterns(v)
 
-class LspNotification(BaseModel):
-    payload: RawNotification
+
+type BatchKind = Literal[
+    "definition", "hover", "locate", "outline", "reference", "search", "symbol"
+]
+
+
+class BatchRequestItem(BaseModel):
+    kind: BatchKind
+    req: dict[str, Any]
+
+
+class BatchRequest(RootModel[list[BatchRequestItem]]):
+    pass
+
+
+class BatchResponseItem(BaseModel):
+    result: Any = None
+    error: str | None = None
+
+
+class BatchResponse(RootModel[list[BatchResponseItem]]):
+    pass
@@ -17,10 +17,23 @@ from lsp_client.server import Server, ServerRuntimeError
 from lsp_client.server.types import ServerRequest
 from lsp_client.utils.channel import Sender
 from lsp_client.utils.workspace import Workspace
+from pydantic import BaseModel
 
 from lsp_cli.utils.socket import wait_socket
 
 
+class LspRequest(BaseModel):
+    payload: RawRequest
+
+
+class LspResponse(BaseModel):
+    payload: RawResponsePackage
+
+
+class LspNotification(BaseModel):
+    payload: RawNotification
+
+
 @final
 @define
 class ManagerServer(Server):
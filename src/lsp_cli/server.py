@@ -1,9 +1,8 @@
 from pathlib import Path
 
 import typer
-from lsp_client.clients.lang import lang_clients
 
-from lsp_cli.client import find_client
+from lsp_cli.client import find_client, supported_languages
 from lsp_cli.manager import (
     CreateClientRequest,
     CreateClientResponse,
@@ -11,9 +10,10 @@ from lsp_cli.manager import (
     DeleteClientResponse,
     ManagedClientInfo,
     ManagedClientInfoList,
-    connect_manager,
+    get_manager_client,
 )
-from lsp_cli.utils.http import HttpClient
+from lsp_cli.settings import MANAGER_UDS_PATH
+from lsp_cli.utils.socket import is_socket_alive
 
 app = typer.Typer(
     name="server",
@@ -34,49 +34,35 @@ def callback(ctx: typer.Context):
         list_servers()
 
 
-def get_manager_client() -> HttpClient:
-    return connect_manager()
-
-
 @app.command("list")
 def list_servers():
     """List all currently running and managed LSP servers."""
-    with get_manager_client() as client:
-        resp = client.get("/list", ManagedClientInfoList)
-        servers = resp.root if resp else []
-        if not servers:
-            print("No servers running.")
-            return
-        print(ManagedClientInfo.format(servers))
+    resp = get_manager_client().get("/list", ManagedClientInfoList)
+    servers = resp.root if resp else []
+    if not servers:
+        print("No servers running.")
+        return
+    print(ManagedClientInfo.format(servers))
 
 
-@app.command("start")
-def start_server(
-    path: Path = typer.Argument(
-        Path.cwd(),
-        help="Path to a code file or project directory to start the LSP server for.",
-    ),
-):
-    """Start a background LSP server for the project containing the specified path."""
+def start_one(path: Path) -> bool:
+    # Make the path absolute once: the manager resolves relative paths
+    # against its own working directory, not ours.
+    path = path.absolute()
+
     # Check if the path exists
     if not path.exists():
-        print(f"Error: Path does not exist: {path.absolute()}")
-        raise typer.Exit(1)
+        print(f"Error: Path does not exist: {path}")
+        return False
 
     # Try to find a language client for this path
     target = find_client(path)
 
     if target is None:
         # No language support found - generate list of supported languages dynamically
-        supported_langs = sorted(
-            {
-                client_cls.get_language_config().kind.value
-                for client_cls in lang_clients.values()
-            }
-        )
-        supported_langs_str = ", ".join(supported_langs)
+        supported_langs_str = ", ".join(supported_languages())
 
-        print(f"Error: Language not supported for path: {path.absolute()}")
+        print(f"Error: Language not supported for path: {path}")
         print()
         print("The CLI cannot analyze code files in this language.")
         print(f"Supported languages: {supported_langs_str}")
@@ -86,31 +72,74 @@ def start_server(
         print(
             "  - The project has the required language markers (e.g., go.mod, Cargo.toml)"
         )
+        return False
+
+    resp = get_manager_client().post(
+        "/create", CreateClientResponse, json=CreateClientRequest(path=path)
+    )
+    assert resp is not None
+    info = resp.info
+    print(f"Success: Started server for {path}")
+    print(ManagedClientInfo.format(info))
+    return True
+
+
+@app.command("start")
+def start_server(
+    paths: list[Path] | None = typer.Argument(
+        None,
+        help="Paths to code files or project directories to start LSP servers for. Defaults to the current directory.",
+        show_default=False,
+    ),
+):
+    """Start background LSP servers for the projects containing the specified paths."""
+    # Start every path even if an earlier one fails, then report the failure
+    results = [start_one(path) for path in paths or [Path.cwd()]]
+    if not all(results):
         raise typer.Exit(1)
 
-    with get_manager_client() as client:
-        resp = client.post(
-            "/create", CreateClientResponse, json=CreateClientRequest(path=path)
-        )
-        assert resp is not None
-        info = resp.info
-        print(f"Success: Started server for {path.absolute()}")
-        print(ManagedClientInfo.format(info))
+
+def stop_all() -> None:
+    # Nothing can be running without a manager; don't spawn one just to ask
+    if not is_socket_alive(MANAGER_UDS_PATH):
+        print("No servers running.")
+        return
+
+    resp = get_manager_client().delete("/delete/all", ManagedClientInfoList)
+    servers = resp.root if resp else []
+    if not servers:
+        print("No servers running.")
+        return
+    for info in servers:
+        print(f"Success: Stopped server for {info.project_path}")
 
 
 @app.command("stop")
 def stop_server(
-    path: Path = typer.Argument(
-        Path.cwd(),
-        help="Path to a code file or project directory to stop the LSP server for.",
+    paths: list[Path] | None = typer.Argument(
+        None,
+        help="Paths to code files or project directories to stop the LSP servers for. Defaults to the current directory.",
+        show_default=False,
+    ),
+    all_servers: bool = typer.Option(
+        False, "--all", help="Stop all running LSP servers."
     ),
 ):
-    """Stop the background LSP server for the project containing the specified path."""
-    with get_manager_client() as client:
-        client.delete(
+    """Stop the background LSP servers for the projects containing the specified paths."""
+    if all_servers:
+        if paths:
+            raise typer.BadParameter(
+                "Cannot be combined with paths.", param_hint="'--all'"
+            )
+        stop_all()
+        return
+
+    for path in paths or [Path.cwd()]:
+        path = path.absolute()
+        get_manager_client().delete(
             "/delete", DeleteClientResponse, json=DeleteClientRequest(path=path)
         )
-        print(f"Success: Stopped server for {path.absolute()}")
+        print(f"Success: Stopped server for {path}")
 
 
 if __name__ == "__main__":
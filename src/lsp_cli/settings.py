@@ -1,7 +1,7 @@
 from pathlib import Path
 from typing import Final, Literal
 
-from platformdirs import user_config_dir, user_log_dir, user_runtime_dir
+from platformdirs import user_cache_dir, user_config_dir, user_log_dir, user_runtime_dir
 from pydantic_settings import (
     BaseSettings,
     PydanticBaseSettingsSource,
@@ -12,16 +12,22 @@ from pydantic_settings import (
 APP_NAME = "lsp-cli"
 CONFIG_PATH = Path(user_config_dir(APP_NAME)) / "config.toml"
 RUNTIME_DIR = Path(user_runtime_dir(APP_NAME))
+CACHE_DIR = Path(user_cache_dir(APP_NAME))
 LOG_DIR = Path(user_log_dir(APP_NAME))
 MANAGER_UDS_PATH = RUNTIME_DIR / "manager.sock"
+MANAGER_LOCK_PATH = RUNTIME_DIR / "manager.lock"
 
 LogLevel = Literal["TRACE", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 
 
 class Settings(BaseSettings):
     debug: bool = False
+    no_cache: bool = False
     idle_timeout: int = 600
     log_level: LogLevel = "INFO"
+    response_cache_size: int = 500
+    root_cache_ttl: float = 3600
+    prewarm_clients: int = 0
 
     # UX improvements
     default_max_items: int | None = 20
@@ -6,6 +6,29 @@ import httpx
 from attrs import define, field
 from pydantic import BaseModel
 
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+def request_kwargs(params: BaseModel | None, json: BaseModel | None) -> dict[str, Any]:
+    """Build httpx request arguments, serializing the body straight to JSON
+    bytes instead of going through an intermediate dict."""
+    kwargs: dict[str, Any] = {}
+    if params:
+        kwargs["params"] = params.model_dump(exclude_none=True, mode="json")
+    if json:
+        kwargs["content"] = json.model_dump_json(exclude_none=True)
+        kwargs["headers"] = JSON_HEADERS
+    return kwargs
+
+
+def parse_response[T: BaseModel](
+    resp: httpx.Response, resp_schema: type[T]
+) -> T | None:
+    resp.raise_for_status()
+    if resp.status_code == 204 or not resp.content or resp.content == b"null":
+        return None
+    return resp_schema.model_validate_json(resp.content)
+
 
 @define
 class HttpClient:
@@ -20,21 +43,8 @@ class HttpClient:
         params: BaseModel | None = None,
         json: BaseModel | None = None,
     ) -> T | None:
-        resp = self.client.request(
-            method,
-            url,
-            params=params.model_dump(exclude_none=True, mode="json")
-            if params
-            else None,
-            json=json.model_dump(exclude_none=True, mode="json") if json else None,
-        )
-        resp.raise_for_status()
-        if resp.status_code == 204 or not resp.content:
-            return None
-        json_data = resp.json()
-        if json_data is None:
-            return None
-        return resp_schema.model_validate(json_data)
+        resp = self.client.request(method, url, **request_kwargs(params, json))
+        return parse_response(resp, resp_schema)
 
     def get[T: BaseModel](
         self,
@@ -108,21 +118,8 @@ class AsyncHttpClient:
         params: BaseModel | None = None,
         json: BaseModel | None = None,
     ) -> T | None:
-        resp = await self.client.request(
-            method,
-            url,
-            params=params.model_dump(exclude_none=True, mode="json")
-            if params
-            else None,
-            json=json.model_dump(exclude_none=True, mode="json") if json else None,
-        )
-        resp.raise_for_status()
-        if resp.status_code == 204 or not resp.content:
-            return None
-        json_data = resp.json()
-        if json_data is None:
-            return None
-        return resp_schema.model_validate(json_data)
+        resp = await self.client.request(method, url, **request_kwargs(params, json))
+        return parse_response(resp, resp_schema)
 
     async def get[T: BaseModel](
         self,
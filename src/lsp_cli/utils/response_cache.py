@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from attrs import define, field
+from loguru import logger
+from pydantic import BaseModel, ValidationError
+
+
+def response_cache_key(file_path: Path, *parts: str) -> str | None:
+    """Build a cache key bound to the current content of `file_path`.
+
+    `file_path` is expected to be absolute and is used as given, without
+    making it absolute or resolving symlinks again.
+
+    Returns `None` if the file cannot be stat'ed, in which case the response
+    should not be cached.
+    """
+    try:
+        mtime_ns = file_path.stat().st_mtime_ns
+    except OSError:
+        return None
+    return json.dumps([file_path.as_posix(), mtime_ns, *parts])
+
+
+@define
+class ResponseCache:
+    """LRU cache of serialized responses, persisted to SQLite across runs."""
+
+    db_path: Path
+    max_entries: int = 500
+
+    _memory: OrderedDict[str, str] = field(init=False, factory=OrderedDict)
+    _conn: sqlite3.Connection | None = field(init=False, default=None)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def _remember(self, key: str, value: str) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get[T: BaseModel](self, key: str, schema: type[T]) -> T | None:
+        value = self._memory.get(key)
+        if value is None:
+            try:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT value FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                value = row[0]
+                with conn:
+                    conn.execute(
+                        "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                        (time.time(), key),
+                    )
+            except sqlite3.Error as e:
+                logger.debug("Response cache read failed: {}", e)
+                return None
+
+        try:
+            resp = schema.model_validate_json(value)
+        except ValidationError:
+            # Written by an incompatible schema version, treat as a miss
+            self._memory.pop(key, None)
+            return None
+
+        self._remember(key, value)
+        return resp
+
+    def put(self, key: str, resp: BaseModel) -> None:
+        value = resp.model_dump_json()
+        self._remember(key, value)
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                    (key, value, time.time()),
+                )
+                conn.execute(
+                    "DELETE FROM responses WHERE key NOT IN ("
+                    "SELECT key FROM responses ORDER BY accessed_at DESC LIMIT ?)",
+                    (self.max_entries,),
+                )
+        except sqlite3.Error as e:
+            logger.debug("Response cache write failed: {}", e)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
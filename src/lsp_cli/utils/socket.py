@@ -5,9 +5,17 @@ import anyio
 from tenacity import AsyncRetrying, stop_after_delay, wait_fixed
 
 
-def is_socket_alive(path: Path) -> bool:
+def is_socket_alive(path: Path, timeout: float = 0.5) -> bool:
+    """Check whether a server is accepting connections on `path`.
+
+    Missing socket files are detected without creating a socket, and the
+    connect attempt is bounded by `timeout` seconds.
+    """
+    if not path.exists():
+        return False
     try:
         with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+            s.settimeout(timeout)
             s.connect(str(path))
             return True
     except OSError:
@@ -22,6 +30,7 @@ async def wait_socket(path: Path, timeout: float = 10.0) -> None:
     ):
         with attempt:
             try:
-                _ = await anyio.connect_unix(path)
+                stream = await anyio.connect_unix(path)
             except (OSError, RuntimeError):
                 raise OSError(f"Socket {path} not ready")
+            await stream.aclose()
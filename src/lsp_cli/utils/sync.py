@@ -1,5 +1,35 @@
-from functools import partial
+import asyncio
+import atexit
+import functools
+from collections.abc import Callable, Coroutine
+from typing import Any
 
-from asyncer import syncify
+_runner: asyncio.Runner | None = None
 
-cli_syncify = partial(syncify, raise_sync_error=False)
+
+def loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Use uvloop when it is installed, like uvicorn's `loop="auto"`."""
+    try:
+        import uvloop  # ty: ignore[unresolved-import]
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def get_runner() -> asyncio.Runner:
+    """Return the process-wide runner, so commands share one event loop."""
+    global _runner
+    if _runner is None:
+        _runner = asyncio.Runner(loop_factory=loop_factory())
+        atexit.register(_runner.close)
+    return _runner
+
+
+def cli_syncify[**P, R](
+    func: Callable[P, Coroutine[Any, Any, R]],
+) -> Callable[P, R]:
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        return get_runner().run(func(*args, **kwargs))
+
+    return wrapper
@@ -1,19 +1,245 @@
 """Shared test fixtures and utilities for LSP CLI tests."""
 
+import os
+import select
+import selectors
+import shlex
 import subprocess
+import sys
+import time
 from pathlib import Path
 
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Run the CLI with the interpreter running the tests, so each command skips
+# the environment resolution `uv run` would redo
+LSP_COMMAND = [sys.executable, "-m", "lsp_cli"]
+
+# Printed by `lsp shell` after each command, followed by its exit code
+SHELL_MARKER = b"@@lsp-cli-test-end@@"
+
+
+def decode(output):
+    """Decode captured output, e.g. for the message of a failed assertion.
+
+    Commands are run without `text=True`, so output that is only searched for
+    a few ASCII names is never decoded as a whole.
+    """
+    return output.decode("utf-8", "replace")
+
+
+def wait_process(proc, timeout):
+    """Wait for `proc` to exit and return its exit code.
+
+    `Popen.wait(timeout)` polls the child with growing sleeps in between, so it
+    returns up to one sleep late. A pidfd becomes readable as soon as the child
+    exits instead. Falls back to `Popen.wait` where pidfds are unavailable.
+    """
+    try:
+        pidfd = os.pidfd_open(proc.pid)
+    except (AttributeError, OSError):
+        return proc.wait(timeout=timeout)
+
+    try:
+        poller = select.poll()
+        poller.register(pidfd, select.POLLIN)
+        if not poller.poll(timeout * 1000):
+            raise subprocess.TimeoutExpired(proc.args, timeout)
+    finally:
+        os.close(pidfd)
+    return proc.wait()
+
+
+def find_managers(runtime_dir):
+    """Return the pids of the managers started with `runtime_dir` as their
+    `XDG_RUNTIME_DIR`, found through /proc."""
+    marker = f"XDG_RUNTIME_DIR={runtime_dir}".encode()
+    pids = []
+    for proc_dir in Path("/proc").iterdir():
+        try:
+            cmdline = (proc_dir / "cmdline").read_bytes().split(b"\0")
+            environ = (proc_dir / "environ").read_bytes().split(b"\0")
+        except OSError:
+            continue
+        if b"lsp_cli.manager" in cmdline and marker in environ:
+            pids.append(int(proc_dir.name))
+    return pids
+
+
+# Paths this process has started servers for and not stopped since
+_started_paths = set()
+
+
+def record_servers(args):
+    """Note the paths of a `server start` or `server stop` command in `args`."""
+    if len(args) < 2 or args[0] != "server":
+        return
+    paths = {str(arg) for arg in args[2:] if not str(arg).startswith("-")}
+    if args[1] == "start":
+        _started_paths.update(paths)
+    elif args[1] == "stop":
+        _started_paths.difference_update(paths)
+
+
+def check_result(result):
+    """Raise `CalledProcessError` if the command failed, noting its stderr."""
+    try:
+        result.check_returncode()
+    except subprocess.CalledProcessError as e:
+        e.add_note(f"stderr: {decode(e.stderr)}")
+        raise
+    return result
+
+
+class LspShell:
+    """A long-running `lsp shell` process that runs one command per line.
+
+    Commands run in the same interpreter one after another, so only the first
+    one pays for the CLI startup. A shell that died, e.g. because it was killed
+    on a timeout, is started again by the next command.
+    """
+
+    def __init__(self):
+        self._proc = self._spawn()
+
+    @staticmethod
+    def _spawn():
+        return subprocess.Popen(
+            LSP_COMMAND + ["shell", "--marker", SHELL_MARKER.decode()],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=_REPO_ROOT,
+        )
+
+    def run(self, *args, timeout=30):
+        """Run an lsp command and return the result."""
+        record_servers(args)
+        if self._proc.poll() is not None:
+            self._proc = self._spawn()
+        assert self._proc.stdin and self._proc.stdout and self._proc.stderr
+        self._proc.stdin.write(shlex.join(args).encode() + b"\n")
+        self._proc.stdin.flush()
+
+        try:
+            stdout, stderr, returncode = self._read_output(timeout)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+            raise subprocess.TimeoutExpired(["lsp", *args], timeout) from None
+        return subprocess.CompletedProcess(["lsp", *args], returncode, stdout, stderr)
+
+    def _read_output(self, timeout):
+        """Read both streams up to their markers at once, so that a full stderr
+        pipe never blocks the shell while stdout is being read."""
+        assert self._proc.stdout and self._proc.stderr
+        buffers = {self._proc.stdout: b"", self._proc.stderr: b""}
+        results = {}
+        deadline = time.monotonic() + timeout
+        with selectors.DefaultSelector() as selector:
+            for stream in buffers:
+                selector.register(stream, selectors.EVENT_READ)
+            while len(results) < len(buffers):
+                events = selector.select(deadline - time.monotonic())
+                if not events:
+                    raise subprocess.TimeoutExpired("lsp shell", timeout)
+                for key, _ in events:
+                    stream = key.fileobj
+                    chunk = os.read(key.fd, 65536)
+                    if not chunk:
+                        raise EOFError("lsp shell exited unexpectedly")
+                    buffers[stream] += chunk
+                    if (result := _split_marker(buffers[stream])) is not None:
+                        results[stream] = result
+                        selector.unregister(stream)
+
+        stdout, returncode = results[self._proc.stdout]
+        stderr, _ = results[self._proc.stderr]
+        return stdout, stderr, returncode
+
+    def close(self):
+        if self._proc.stdin:
+            self._proc.stdin.close()
+        try:
+            wait_process(self._proc, timeout=10)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+
+
+def _split_marker(output):
+    """Split `output` at the marker line, returning the output before it and
+    the exit code it carries, or `None` until the whole line has arrived."""
+    if output.startswith(SHELL_MARKER):
+        start = 0
+    elif (start := output.find(b"\n" + SHELL_MARKER)) != -1:
+        start += 1
+    else:
+        return None
+    end = output.find(b"\n", start)
+    if end == -1:
+        return None
+    return output[:start], int(output[start:end].split()[1])
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _stop_leaked_servers():
+    """Stop servers this session started but left running, e.g. because a test
+    failed before stopping them.
+
+    Other servers are left alone, including those of a developer's own work.
+    Under xdist, each worker stops the servers it recorded itself.
+    """
+    yield
+    if not _started_paths:
+        return
+    subprocess.run(
+        LSP_COMMAND + ["server", "stop", *sorted(_started_paths)],
+        capture_output=True,
+        timeout=30,
+        cwd=_REPO_ROOT,
+    )
+
+
+@pytest.fixture(scope="session")
+def lsp_shell():
+    """Return the `lsp shell` shared by all tests of the session."""
+    shell = LspShell()
+    yield shell
+    shell.close()
+
+
+@pytest.fixture(autouse=True)
+def _use_lsp_shell(request):
+    """Route the commands of `BaseLSPTest` tests through the shared shell."""
+    if isinstance(request.instance, BaseLSPTest):
+        request.instance.shell = request.getfixturevalue("lsp_shell")
+
 
 class BaseLSPTest:
     """Base class for LSP CLI tests with common helper methods."""
 
-    def run_lsp_command(self, *args, timeout=30):
-        """Run an lsp command and return the result."""
-        result = subprocess.run(
-            ["uv", "run", "lsp"] + list(args),
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            cwd=Path(__file__).parent.parent,
-        )
-        return result
+    shell: LspShell | None = None
+
+    def run_lsp_command(self, *args, timeout=30, check=True):
+        """Run an lsp command and return the result.
+
+        With `check`, a non-zero exit code raises `CalledProcessError`.
+        """
+        if self.shell is not None:
+            result = self.shell.run(*args, timeout=timeout)
+        else:
+            record_servers(args)
+            result = subprocess.run(
+                LSP_COMMAND + list(args),
+                capture_output=True,
+                timeout=timeout,
+                cwd=_REPO_ROOT,
+            )
+        return check_result(result) if check else result
+
+    def list_servers(self):
+        """Run `server list` and return its output."""
+        return self.run_lsp_command("server", "list").stdout
@@ -0,0 +1,86 @@
+"""
+Tests for `lsp batch`, which runs NDJSON queries from stdin.
+
+The queries of each project go to its server in a single request, and one
+result or error is written per input line, in input order.
+"""
+
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+from conftest import LSP_COMMAND, check_result
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+_SETTINGS_FILE = "src/lsp_cli/settings.py"
+
+
+@pytest.fixture(scope="module")
+def python_server(lsp_shell):
+    """Start the server the queries run against once for the module."""
+    check_result(lsp_shell.run("server", "start", _SETTINGS_FILE))
+    yield
+    check_result(lsp_shell.run("server", "stop", _SETTINGS_FILE))
+
+
+def run_batch(*lines, timeout=60):
+    """Run `lsp batch` on the given input lines and return the parsed output."""
+    result = check_result(
+        subprocess.run(
+            LSP_COMMAND + ["batch"],
+            input="".join(f"{line}\n" for line in lines).encode(),
+            capture_output=True,
+            timeout=timeout,
+            cwd=_REPO_ROOT,
+        )
+    )
+    return [json.loads(line) for line in result.stdout.splitlines()]
+
+
+def query(cmd, locate, **fields):
+    return json.dumps({"cmd": cmd, "locate": locate, **fields})
+
+
+@pytest.mark.usefixtures("python_server")
+class TestBatch:
+    """Test running queries through `lsp batch`."""
+
+    def test_output_order_matches_input(self):
+        """Test that each output line answers the input line at its index."""
+        lines = [14, 12, 17, 13]
+        output = run_batch(*(query("locate", f"{_SETTINGS_FILE}:{n}") for n in lines))
+
+        assert len(output) == len(lines)
+        for line, item in zip(lines, output, strict=True):
+            assert "error" not in item, item
+            assert item["result"]["position"]["line"] == line
+            assert Path(item["result"]["file_path"]) == Path(_SETTINGS_FILE)
+
+    def test_error_does_not_abort_batch(self):
+        """Test that a failing query only fails its own line."""
+        output = run_batch(
+            query("locate", f"{_SETTINGS_FILE}:12"),
+            query("hover", "src/lsp_cli/missing.py:1"),
+            query("hover", f"{_SETTINGS_FILE}@APP_NAME"),
+        )
+
+        assert len(output) == 3
+        assert output[0]["result"]["position"]["line"] == 12
+        assert "File not found" in output[1]["error"]
+        assert "APP_NAME" in output[2]["result"]["content"]
+
+    def test_malformed_line(self):
+        """Test that a line that is not a valid query is reported in place."""
+        output = run_batch(
+            "not json",
+            query("rename", f"{_SETTINGS_FILE}:12"),
+            query("hover", f"{_SETTINGS_FILE}@APP_NAME", mode="declaration"),
+            query("locate", f"{_SETTINGS_FILE}:12"),
+        )
+
+        assert len(output) == 4
+        assert "Invalid JSON" in output[0]["error"]
+        assert output[1]["error"]
+        assert "'mode' is only supported" in output[2]["error"]
+        assert output[3]["result"]["position"]["line"] == 12
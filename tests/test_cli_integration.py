@@ -5,11 +5,14 @@ This tests actual CLI command execution to verify that the server
 management system works correctly in real-world usage scenarios.
 """
 
+import os
+import signal
 import subprocess
 import time
 from pathlib import Path
 
 import pytest
+from conftest import LSP_COMMAND, find_managers, record_servers
 
 
 @pytest.fixture(scope="module")
@@ -23,6 +26,7 @@ class TestCLIIntegration:
 
     def run_lsp_command(self, *args, timeout=30):
         """Run an lsp command and return the result."""
+        record_servers(args)
         result = subprocess.run(
             ["uv", "run", "lsp"] + list(args),
             capture_output=True,
@@ -68,6 +72,7 @@ class TestRapidCLICommands:
 
     def run_lsp_command(self, *args, timeout=30):
         """Run an lsp command and return the result."""
+        record_servers(args)
         result = subprocess.run(
             ["uv", "run", "lsp"] + list(args),
             capture_output=True,
@@ -147,6 +152,7 @@ class TestConnectionReliability:
 
     def run_lsp_command(self, *args, timeout=30):
         """Run an lsp command and return the result."""
+        record_servers(args)
         result = subprocess.run(
             ["uv", "run", "lsp"] + list(args),
             capture_output=True,
@@ -192,3 +198,92 @@ class TestConnectionReliability:
         # Subsequent commands should work
         result = self.run_lsp_command("server", "list")
         assert result.returncode == 0, f"Manager not responding: {result.stderr}"
+
+
+@pytest.fixture
+def isolated_env(tmp_path_factory):
+    """Return an environment whose commands use a manager of their own.
+
+    `stop --all` stops every server of a manager, so it must not reach the
+    one the other tests (or a developer) share.
+    """
+    runtime_dir = tmp_path_factory.mktemp("run")
+    yield {**os.environ, "XDG_RUNTIME_DIR": str(runtime_dir)}
+    # The manager leads its own process group, so this also ends the language
+    # servers it started
+    for pid in find_managers(runtime_dir):
+        os.killpg(pid, signal.SIGKILL)
+
+
+@pytest.fixture
+def python_projects(tmp_path):
+    """Create two Python projects, returning a file of each."""
+    files = []
+    for name in ("one", "two"):
+        project = tmp_path / name
+        project.mkdir()
+        (project / "pyproject.toml").write_text(f'[project]\nname = "{name}"\n')
+        (project / "main.py").write_text("x = 1\n")
+        files.append(project / "main.py")
+    return files
+
+
+@pytest.mark.skipif(not Path("/proc/self/environ").exists(), reason="needs /proc")
+class TestServerCommands:
+    """Test starting several servers at once and stopping all of them."""
+
+    def run_lsp_command(self, env, *args, timeout=60):
+        """Run an lsp command in `env` and return the result."""
+        return subprocess.run(
+            LSP_COMMAND + list(args),
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            cwd=Path(__file__).parent.parent,
+            env=env,
+        )
+
+    def test_start_several_paths(self, isolated_env, python_projects):
+        """Test that one `server start` starts a server for each path."""
+        result = self.run_lsp_command(
+            isolated_env, "server", "start", *map(str, python_projects)
+        )
+        assert result.returncode == 0, f"Command failed: {result.stderr}"
+
+        listed = self.run_lsp_command(isolated_env, "server", "list").stdout
+        for file in python_projects:
+            assert f"Started server for {file}" in result.stdout
+            assert str(file.parent) in listed
+
+    def test_start_continues_after_failure(self, isolated_env, python_projects):
+        """Test that a failing path fails the command after the others start."""
+        missing = python_projects[0].parent / "missing.py"
+        result = self.run_lsp_command(
+            isolated_env, "server", "start", str(missing), str(python_projects[1])
+        )
+        assert result.returncode == 1
+
+        listed = self.run_lsp_command(isolated_env, "server", "list").stdout
+        assert str(python_projects[1].parent) in listed
+
+    def test_stop_all(self, isolated_env, python_projects):
+        """Test that `server stop --all` leaves no server running."""
+        self.run_lsp_command(
+            isolated_env, "server", "start", *map(str, python_projects)
+        )
+
+        result = self.run_lsp_command(isolated_env, "server", "stop", "--all")
+        assert result.returncode == 0, f"Command failed: {result.stderr}"
+        for file in python_projects:
+            assert f"Stopped server for {file.parent}" in result.stdout
+
+        listed = self.run_lsp_command(isolated_env, "server", "list")
+        assert listed.stdout.strip() == "No servers running."
+
+    def test_stop_all_rejects_paths(self, isolated_env, python_projects):
+        """Test that `--all` cannot be combined with paths."""
+        result = self.run_lsp_command(
+            isolated_env, "server", "stop", "--all", str(python_projects[0])
+        )
+        assert result.returncode == 2
+        assert "Cannot be combined with paths" in result.stderr
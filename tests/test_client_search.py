@@ -0,0 +1,39 @@
+"""Tests for project root discovery."""
+
+from lsp_cli.client import search_client
+
+
+class TestSearchClient:
+    """Test the single upward walk over all candidate languages."""
+
+    def test_nearest_root_for_single_language(self, tmp_path):
+        """The closest directory holding a project marker is the root."""
+        (tmp_path / "pyproject.toml").touch()
+        inner = tmp_path / "pkg" / "sub"
+        inner.mkdir(parents=True)
+        (tmp_path / "pkg" / "setup.py").touch()
+
+        found = search_client(inner, ("python",))
+
+        assert found is not None
+        lang, target = found
+        assert lang == "python"
+        assert target.project_path == tmp_path / "pkg"
+
+    def test_language_order_wins_over_depth(self, tmp_path):
+        """Earlier languages take precedence even if their root is further up."""
+        (tmp_path / "go.mod").touch()
+        inner = tmp_path / "app"
+        inner.mkdir()
+        (inner / "pyproject.toml").touch()
+
+        found = search_client(inner, ("go", "python"))
+
+        assert found is not None
+        lang, target = found
+        assert lang == "go"
+        assert target.project_path == tmp_path
+
+    def test_no_markers(self, tmp_path):
+        """Without markers for any candidate language there is no client."""
+        assert search_client(tmp_path, ("rust",)) is None
@@ -0,0 +1,91 @@
+"""Tests for turning exceptions into the messages the CLI prints."""
+
+import httpx
+from pydantic import BaseModel, field_validator
+
+from lsp_cli.cli.shared import get_msg
+
+
+class Port(BaseModel):
+    port: int
+
+    @field_validator("port")
+    @classmethod
+    def check_port(cls, port: int) -> int:
+        if port <= 0:
+            raise ValueError("Port must be positive")
+        return port
+
+
+def validation_error():
+    try:
+        Port(port=0)
+    except ValueError as e:
+        return e
+    raise AssertionError("Port(port=0) did not fail")
+
+
+class TestGetMsg:
+    """Test describing exceptions and exception groups."""
+
+    def test_plain_exception(self):
+        """An exception without a handler is described by its text."""
+        assert get_msg(RuntimeError("boom")) == "boom"
+
+    def test_flattens_nested_groups_in_order(self):
+        """Nested groups give one line per leaf exception, depth first."""
+        err = ExceptionGroup(
+            "outer",
+            [
+                RuntimeError("a"),
+                ExceptionGroup("inner", [RuntimeError("b"), RuntimeError("c")]),
+                RuntimeError("d"),
+            ],
+        )
+
+        assert get_msg(err) == "a\nb\nc\nd"
+
+    def test_drops_adjacent_duplicates(self):
+        """Repeated messages are shown once, unless others come in between."""
+        err = ExceptionGroup(
+            "group",
+            [
+                RuntimeError("same"),
+                ExceptionGroup("inner", [RuntimeError("same")]),
+                RuntimeError("other"),
+                RuntimeError("same"),
+            ],
+        )
+
+        assert get_msg(err) == "same\nother\nsame"
+
+    def test_subclass_uses_most_specific_handler(self):
+        """A `ValidationError` is a `ValueError`, but uses its own handler."""
+        assert get_msg(validation_error()) == "Port must be positive"
+
+    def test_subclass_uses_base_handler(self):
+        """Subclasses without a handler of their own use their base's."""
+        err = FileNotFoundError(2, "No such file or directory", "/missing.py")
+
+        assert get_msg(err) == "No such file or directory: /missing.py"
+
+    def test_value_error(self):
+        """Invalid numbers are reported as a bad locate string."""
+        try:
+            int("x")
+        except ValueError as e:
+            err = e
+
+        assert get_msg(err) == "Invalid line number or range in locate string: 'x'"
+
+    def test_http_status_error_detail(self):
+        """The `detail` of an error response is shown without its errno."""
+        request = httpx.Request("POST", "http://localhost/create")
+        response = httpx.Response(
+            404,
+            json={"detail": "[Errno 2] No LSP client found"},
+            request=request,
+        )
+        err = httpx.HTTPStatusError("Not Found", request=request, response=response)
+
+        assert get_msg(ExceptionGroup("group", [err])) == "No LSP client found"
@@ -15,248 +15,197 @@ Each test verifies that the CLI can:
 3. Stop the server cleanly
 """
 
+import re
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
-from conftest import BaseLSPTest
+from conftest import BaseLSPTest, check_result, decode
 
+_FIXTURES = Path(__file__).resolve().parent / "fixtures"
+# Use the actual source code as a Python project
+_PY_FIXTURE = Path(__file__).resolve().parents[1] / "src" / "lsp_cli" / "__init__.py"
 
-@pytest.fixture(scope="module")
-def fixtures_dir():
-    """Return the path to the test fixtures directory."""
-    return Path(__file__).parent / "fixtures"
+# Language names in `server list` output, including those in project paths.
+# "go" must be a word of its own, so that e.g. a "cargo" path does not count.
+_LANGUAGE_RE = re.compile(
+    rb"python|tsserver|typescript|javascript|jsserver|rust|deno|\bgo\b",
+    re.IGNORECASE,
+)
 
 
-class TestLanguageSupport(BaseLSPTest):
-    """Test that each supported language works with LSP CLI."""
+# Languages whose servers `test_multiple_language_servers` starts and stops
+_MULTI_LANGUAGES = ("python", "go", "rust")
 
-    def test_python_support(self, fixtures_dir):
-        """Test basic LSP operations with Python project."""
-        # Use the actual source code as a Python project
-        python_file = fixtures_dir.parent.parent / "src" / "lsp_cli" / "__init__.py"
-        assert python_file.exists(), "Python test file does not exist"
 
-        try:
-            # Start server
-            result = self.run_lsp_command("server", "start", str(python_file))
-            assert result.returncode == 0, (
-                f"Failed to start Python server: {result.stderr}"
-            )
+def xdist_group(lang):
+    """Mark a test that touches the server of `lang`.
 
-            # List servers - should show Python server
-            result = self.run_lsp_command("server", "list")
-            assert result.returncode == 0, f"Failed to list servers: {result.stderr}"
-            assert "python" in result.stdout.lower(), "Python server not listed"
-        finally:
-            # Stop server
-            result = self.run_lsp_command("server", "stop", str(python_file))
-            assert result.returncode == 0, (
-                f"Failed to stop Python server: {result.stderr}"
-            )
+    Tests sharing a server run on the same worker. The languages of the
+    cross-language test share one group, so it never races their other tests.
+    """
+    return pytest.mark.xdist_group(name="multi" if lang in _MULTI_LANGUAGES else lang)
 
-    def test_go_support(self, fixtures_dir):
-        """Test basic LSP operations with Go project."""
-        go_file = fixtures_dir / "go_project" / "main.go"
-        assert go_file.exists(), "Go test file does not exist"
 
-        try:
-            # Start server
-            result = self.run_lsp_command("server", "start", str(go_file))
-            assert result.returncode == 0, f"Failed to start Go server: {result.stderr}"
-
-            # List servers - should show Go server
-            result = self.run_lsp_command("server", "list")
-            assert result.returncode == 0, f"Failed to list servers: {result.stderr}"
-            assert "go" in result.stdout.lower(), "Go server not listed"
-        finally:
-            # Stop server
-            result = self.run_lsp_command("server", "stop", str(go_file))
-            assert result.returncode == 0, f"Failed to stop Go server: {result.stderr}"
+def listed_languages(output):
+    """Return the language names found in the raw `output`, in one scan."""
+    return {name.lower().decode() for name in _LANGUAGE_RE.findall(output)}
 
-    def test_rust_support(self, fixtures_dir):
-        """Test basic LSP operations with Rust project."""
-        rust_file = fixtures_dir / "rust_project" / "src" / "main.rs"
-        assert rust_file.exists(), "Rust test file does not exist"
 
-        try:
-            # Start server
-            result = self.run_lsp_command("server", "start", str(rust_file))
-            assert result.returncode == 0, (
-                f"Failed to start Rust server: {result.stderr}"
-            )
-
-            # List servers - should show Rust server
-            result = self.run_lsp_command("server", "list")
-            assert result.returncode == 0, f"Failed to list servers: {result.stderr}"
-            assert "rust" in result.stdout.lower(), "Rust server not listed"
-        finally:
-            # Stop server
-            result = self.run_lsp_command("server", "stop", str(rust_file))
-            assert result.returncode == 0, (
-                f"Failed to stop Rust server: {result.stderr}"
-            )
+@pytest.fixture(scope="session")
+def fixtures_dir():
+    """Return the path to the test fixtures directory."""
+    return _FIXTURES
+
+
+@pytest.fixture(scope="session")
+def language_files(fixtures_dir):
+    """Return the sample file of each language, keeping only existing ones.
+
+    Paths are resolved and checked once per session and stored as the strings
+    passed to the CLI, in a read-only mapping shared by all tests.
+    """
+    paths = {
+        "python": _PY_FIXTURE,
+        "go": fixtures_dir / "go_project" / "main.go",
+        "rust": fixtures_dir / "rust_project" / "src" / "main.rs",
+        "typescript": fixtures_dir / "typescript_project" / "index.ts",
+        "javascript": fixtures_dir / "javascript_project" / "index.js",
+        "deno": fixtures_dir / "deno_project" / "main.ts",
+    }
+    return MappingProxyType(
+        {
+            lang: str(path.resolve(strict=False))
+            for lang, path in paths.items()
+            if path.is_file()
+        }
+    )
+
+
+def language_file(language_files, lang):
+    """Return the sample file of `lang`, skipping the test if it is missing."""
+    if lang not in language_files:
+        pytest.skip(f"{lang} test file does not exist")
+    return language_files[lang]
 
-    def test_typescript_support(self, fixtures_dir):
-        """Test basic LSP operations with TypeScript project."""
-        ts_file = fixtures_dir / "typescript_project" / "index.ts"
-        assert ts_file.exists(), "TypeScript test file does not exist"
 
-        try:
-            # Start server
-            result = self.run_lsp_command("server", "start", str(ts_file))
-            assert result.returncode == 0, (
-                f"Failed to start TypeScript server: {result.stderr}"
-            )
+@pytest.fixture(scope="module")
+def started_server(request, language_files, lsp_shell):
+    """Start the server of the language in `request.param` once per module.
 
-            # List servers - should show TypeScript server
-            result = self.run_lsp_command("server", "list")
-            assert result.returncode == 0, f"Failed to list servers: {result.stderr}"
-            # Note: TypeScript may be identified as "typescript" or abbreviated form
-            # We check for both to handle different language server implementations
-            stdout_lower = result.stdout.lower()
-            assert "typescript" in stdout_lower or "tsserver" in stdout_lower, (
-                f"TypeScript server not listed. Output: {result.stdout}"
-            )
-        finally:
-            # Stop server
-            result = self.run_lsp_command("server", "stop", str(ts_file))
-            assert result.returncode == 0, (
-                f"Failed to stop TypeScript server: {result.stderr}"
-            )
+    Tests parametrized with the same language share the running server, which
+    is stopped when the module is done with it.
+    """
+    file_path = language_file(language_files, request.param)
 
-    def test_javascript_support(self, fixtures_dir):
-        """Test basic LSP operations with JavaScript project."""
-        js_file = fixtures_dir / "javascript_project" / "index.js"
-        assert js_file.exists(), "JavaScript test file does not exist"
+    check_result(lsp_shell.run("server", "start", file_path))
+    yield file_path
+    check_result(lsp_shell.run("server", "stop", file_path))
 
-        try:
-            # Start server
-            result = self.run_lsp_command("server", "start", str(js_file))
-            assert result.returncode == 0, (
-                f"Failed to start JavaScript server: {result.stderr}"
-            )
 
-            # List servers - should show JavaScript server
-            result = self.run_lsp_command("server", "list")
-            assert result.returncode == 0, f"Failed to list servers: {result.stderr}"
-            # Note: JavaScript may be identified as "javascript" or abbreviated form
-            # We check for both to handle different language server implementations
-            stdout_lower = result.stdout.lower()
-            assert "javascript" in stdout_lower or "jsserver" in stdout_lower, (
-                f"JavaScript server not listed. Output: {result.stdout}"
-            )
-        finally:
-            # Stop server
-            result = self.run_lsp_command("server", "stop", str(js_file))
-            assert result.returncode == 0, (
-                f"Failed to stop JavaScript server: {result.stderr}"
-            )
-
-    def test_deno_support(self, fixtures_dir):
-        """Test basic LSP operations with Deno project."""
-        deno_file = fixtures_dir / "deno_project" / "main.ts"
-        assert deno_file.exists(), "Deno test file does not exist"
-
-        try:
-            # Start server
-            result = self.run_lsp_command("server", "start", str(deno_file))
-            assert result.returncode == 0, (
-                f"Failed to start Deno server: {result.stderr}"
-            )
+class TestLanguageSupport(BaseLSPTest):
+    """Test that each supported language works with LSP CLI."""
 
-            # List servers - should show Deno server
-            result = self.run_lsp_command("server", "list")
-            assert result.returncode == 0, f"Failed to list servers: {result.stderr}"
-            assert "deno" in result.stdout.lower(), "Deno server not listed"
-        finally:
-            # Always attempt to stop the server to avoid leaking processes
-            stop_result = self.run_lsp_command("server", "stop", str(deno_file))
-            assert stop_result.returncode == 0, (
-                f"Failed to stop Deno server: {stop_result.stderr}"
+    @pytest.mark.parametrize(
+        ("started_server", "names"),
+        [
+            pytest.param(
+                lang,
+                names,
+                id=lang,
+                marks=xdist_group(lang),
             )
+            for lang, names in [
+                ("python", ("python",)),
+                ("go", ("go",)),
+                ("rust", ("rust",)),
+                # TypeScript and JavaScript may be identified by an abbreviated
+                # form, depending on the language server implementation
+                ("typescript", ("typescript", "tsserver")),
+                ("javascript", ("javascript", "jsserver")),
+                ("deno", ("deno",)),
+            ]
+        ],
+        indirect=["started_server"],
+        # Module-scoped like `started_server`, so that pytest runs the
+        # lifecycle tests sharing the Python server right after its case here
+        scope="module",
+    )
+    def test_support(self, started_server, names):
+        """Test basic LSP operations with a project of each language."""
+        # List servers - should show the server of the language
+        output = self.list_servers()
+        assert not listed_languages(output).isdisjoint(names), (
+            f"{names[0]} server not listed. Output: {decode(output)}"
+        )
 
 
 class TestLanguageServerLifecycle(BaseLSPTest):
     """Test language server lifecycle for all supported languages."""
 
-    def test_multiple_language_servers(self, fixtures_dir):
+    @xdist_group("python")
+    @pytest.mark.parametrize("started_server", ["python"], indirect=True)
+    def test_multiple_language_servers(self, started_server, language_files):
         """Test running multiple language servers simultaneously."""
-        # Start servers for different languages
-        python_file = fixtures_dir.parent.parent / "src" / "lsp_cli" / "__init__.py"
-        go_file = fixtures_dir / "go_project" / "main.go"
-        rust_file = fixtures_dir / "rust_project" / "src" / "main.rs"
+        files = {
+            lang: language_files[lang]
+            for lang in _MULTI_LANGUAGES
+            if lang in language_files
+        }
+        if len(files) < 2:
+            pytest.skip("Need test files of at least two languages")
 
         servers = []
         try:
-            if python_file.exists():
-                result = self.run_lsp_command("server", "start", str(python_file))
-                if result.returncode == 0:
-                    servers.append(("python", python_file))
-
-            if go_file.exists():
-                result = self.run_lsp_command("server", "start", str(go_file))
-                if result.returncode == 0:
-                    servers.append(("go", go_file))
-
-            if rust_file.exists():
-                result = self.run_lsp_command("server", "start", str(rust_file))
-                if result.returncode == 0:
-                    servers.append(("rust", rust_file))
+            # Start servers for different languages with a single command,
+            # tolerating languages whose server cannot be started here
+            result = self.run_lsp_command(
+                "server", "start", *files.values(), check=False
+            )
+            servers = [
+                (lang, file_path)
+                for lang, file_path in files.items()
+                if f"Started server for {file_path}".encode() in result.stdout
+            ]
 
             # List should show multiple servers
-            result = self.run_lsp_command("server", "list")
-            assert result.returncode == 0, f"Failed to list servers: {result.stderr}"
+            listed = listed_languages(self.list_servers())
 
             # Verify each started server is listed
             for lang, _ in servers:
-                assert lang in result.stdout.lower(), f"{lang} server not found in list"
+                assert lang in listed, f"{lang} server not found in list"
         finally:
-            # Stop all servers
-            for _, file_path in servers:
-                result = self.run_lsp_command("server", "stop", str(file_path))
-                assert result.returncode == 0, f"Failed to stop server for {file_path}"
-
-    def test_language_server_reuse(self, fixtures_dir):
+            # Stop the servers this test started, leaving the one owned by
+            # `started_server` to the fixture
+            if stopped := [
+                file_path for _, file_path in servers if file_path != started_server
+            ]:
+                self.run_lsp_command("server", "stop", *stopped)
+
+    @xdist_group("python")
+    @pytest.mark.parametrize("started_server", ["python"], indirect=True)
+    def test_language_server_reuse(self, started_server):
         """Test that starting a server twice reuses the same server."""
-        python_file = fixtures_dir.parent.parent / "src" / "lsp_cli" / "__init__.py"
-        assert python_file.exists(), "Python test file does not exist"
+        python_file = started_server
 
-        server_started = False
-        try:
-            # Start server first time
-            result1 = self.run_lsp_command("server", "start", str(python_file))
-            assert result1.returncode == 0, (
-                f"Failed to start server first time: {result1.stderr}"
-            )
-            server_started = True
+        # Get server list
+        list1 = self.list_servers()
 
-            # Get server list
-            list1 = self.run_lsp_command("server", "list")
-            assert list1.returncode == 0
-
-            # Start server second time (should reuse)
-            result2 = self.run_lsp_command("server", "start", str(python_file))
-            assert result2.returncode == 0, (
-                f"Failed to start server second time: {result2.stderr}"
-            )
+        # Start server second time (should reuse)
+        self.run_lsp_command("server", "start", python_file)
 
-            # Get server list again
-            list2 = self.run_lsp_command("server", "list")
-            assert list2.returncode == 0
+        # Get server list again
+        list2 = self.list_servers()
 
-            # Should have the same number of servers for this specific Python file
-            python_file_str = str(python_file)
-            python_servers1 = [
-                line for line in list1.stdout.splitlines() if python_file_str in line
-            ]
-            python_servers2 = [
-                line for line in list2.stdout.splitlines() if python_file_str in line
-            ]
-            assert len(python_servers1) == len(python_servers2), "Server was not reused"
-        finally:
-            # Cleanup
-            if server_started:
-                self.run_lsp_command("server", "stop", str(python_file))
+        # Should have the same number of servers for this specific Python file
+        python_file_bytes = python_file.encode()
+        python_servers1 = [
+            line for line in list1.splitlines() if python_file_bytes in line
+        ]
+        python_servers2 = [
+            line for line in list2.splitlines() if python_file_bytes in line
+        ]
+        assert len(python_servers1) == len(python_servers2), "Server was not reused"
 
 
 class TestLanguageServerErrors(BaseLSPTest):
@@ -266,30 +215,36 @@ class TestLanguageServerErrors(BaseLSPTest):
         """Test that invalid file paths are handled gracefully."""
         invalid_file = Path("/nonexistent/path/file.py")
 
-        # Invalid path should result in a non-zero exit code, not a successful run
-        result = self.run_lsp_command("server", "start", str(invalid_file))
-        assert result.returncode != 0, (
-            "Expected non-zero exit code for invalid file path.\n"
-            f"stdout: {result.stdout}\n"
-            f"stderr: {result.stderr}"
-        )
+        try:
+            # Invalid path should result in a non-zero exit code, not a successful run
+            result = self.run_lsp_command(
+                "server", "start", str(invalid_file), check=False
+            )
+            assert result.returncode != 0, (
+                "Expected non-zero exit code for invalid file path.\n"
+                f"stdout: {decode(result.stdout)}\n"
+                f"stderr: {decode(result.stderr)}"
+            )
+        finally:
+            # Best effort, in case a server was started after all
+            self.run_lsp_command("server", "stop", str(invalid_file), check=False)
 
-    def test_unsupported_language(self, fixtures_dir):
+    def test_unsupported_language(self, tmp_path):
         """Test that unsupported file types are handled gracefully."""
         # Create a temporary file with unsupported extension
-        unsupported_file = fixtures_dir / "test.unsupported"
-        unsupported_file.parent.mkdir(parents=True, exist_ok=True)
+        unsupported_file = tmp_path / "test.unsupported"
         unsupported_file.write_text("test content")
 
         try:
             # Should handle gracefully by returning a non-zero exit code
-            result = self.run_lsp_command("server", "start", str(unsupported_file))
+            result = self.run_lsp_command(
+                "server", "start", str(unsupported_file), check=False
+            )
             # Unsupported file types should not start a server successfully
             assert result.returncode != 0, (
                 f"Expected non-zero exit code for unsupported file type, "
                 f"got {result.returncode}. stdout: {result.stdout!r} stderr: {result.stderr!r}"
             )
         finally:
-            # Cleanup
-            if unsupported_file.exists():
-                unsupported_file.unlink()
+            # Best effort, in case a server was started after all
+            self.run_lsp_command("server", "stop", str(unsupported_file), check=False)
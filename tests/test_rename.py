@@ -0,0 +1,67 @@
+"""
+Tests for `lsp rename apply`, which previews and executes a rename in one step.
+"""
+
+import pytest
+from conftest import BaseLSPTest, check_result
+
+
+@pytest.fixture
+def python_project(tmp_path, lsp_shell):
+    """Create a Python project whose symbol is used across two files."""
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "demo"\n')
+    (tmp_path / "a.py").write_text("def old_name():\n    return 1\n")
+    (tmp_path / "b.py").write_text("from a import old_name\n\nprint(old_name())\n")
+    yield tmp_path
+    check_result(lsp_shell.run("server", "stop", str(tmp_path / "a.py")))
+
+
+class TestRenameApply(BaseLSPTest):
+    """Test applying renames to the files of a project."""
+
+    def test_apply_writes_files(self, python_project):
+        """Test that the rename is written to every file using the symbol."""
+        self.run_lsp_command(
+            "rename", "apply", "new_name", "-L", f"{python_project / 'a.py'}@old_name"
+        )
+
+        assert (python_project / "a.py").read_text() == (
+            "def new_name():\n    return 1\n"
+        )
+        assert (python_project / "b.py").read_text() == (
+            "from a import new_name\n\nprint(new_name())\n"
+        )
+
+    def test_apply_excludes_files(self, python_project):
+        """Test that excluded files are left untouched."""
+        self.run_lsp_command(
+            "rename",
+            "apply",
+            "new_name",
+            "-L",
+            f"{python_project / 'a.py'}@old_name",
+            "--exclude",
+            "b.py",
+        )
+
+        assert "def new_name()" in (python_project / "a.py").read_text()
+        assert (python_project / "b.py").read_text() == (
+            "from a import old_name\n\nprint(old_name())\n"
+        )
+
+    def test_apply_without_symbol_fails(self, python_project):
+        """Test that renaming where there is no symbol fails without writing."""
+        result = self.run_lsp_command(
+            "rename",
+            "apply",
+            "new_name",
+            "-L",
+            f"{python_project / 'a.py'}:2",
+            check=False,
+        )
+
+        assert result.returncode == 1
+        assert b"Failed to apply rename" in result.stderr
+        assert (python_project / "a.py").read_text() == (
+            "def old_name():\n    return 1\n"
+        )
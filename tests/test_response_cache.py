@@ -0,0 +1,56 @@
+"""Tests for the persistent response cache used by read-only CLI commands."""
+
+import os
+
+from lsap.schema.hover import HoverResponse
+
+from lsp_cli.utils.response_cache import ResponseCache, response_cache_key
+
+
+class TestResponseCacheKey:
+    """Test cache key construction."""
+
+    def test_key_changes_with_mtime(self, tmp_path):
+        """Touching the file must invalidate previously built keys."""
+        file = tmp_path / "main.py"
+        file.write_text("x = 1\n")
+        key1 = response_cache_key(file, "/capability/hover", "{}")
+
+        stat = file.stat()
+        os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        key2 = response_cache_key(file, "/capability/hover", "{}")
+
+        assert key1 is not None
+        assert key1 != key2
+
+    def test_missing_file_has_no_key(self, tmp_path):
+        """Files that cannot be stat'ed are never cached."""
+        assert response_cache_key(tmp_path / "missing.py", "/x") is None
+
+
+class TestResponseCache:
+    """Test in-memory and on-disk caching."""
+
+    def test_roundtrip_across_instances(self, tmp_path):
+        """Responses survive a new cache instance (i.e. a new CLI process)."""
+        db = tmp_path / "responses.sqlite"
+        resp = HoverResponse(content="hello")
+
+        cache = ResponseCache(db)
+        cache.put("key", resp)
+        cache.close()
+
+        reopened = ResponseCache(db)
+        assert reopened.get("key", HoverResponse) == resp
+        assert reopened.get("other", HoverResponse) is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Only `max_entries` responses are kept."""
+        cache = ResponseCache(tmp_path / "responses.sqlite", max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.put(key, HoverResponse(content=key))
+        cache.close()
+
+        reopened = ResponseCache(tmp_path / "responses.sqlite", max_entries=2)
+        assert reopened.get("a", HoverResponse) is None
+        assert reopened.get("c", HoverResponse) == HoverResponse(content="c")
@@ -5,23 +5,34 @@ This module tests that the server management system works reliably,
 ensuring that commands can always connect to the server without failures.
 """
 
+import os
+import signal
 import subprocess
 import sys
 import time
 from pathlib import Path
+from typing import cast
 
 import anyio
 import httpx
 import pytest
+from conftest import find_managers, wait_process
 
+from lsp_cli.cli.shared import lookup_client
+from lsp_cli.client import find_client
 from lsp_cli.manager import (
     CreateClientRequest,
     CreateClientResponse,
     DeleteClientRequest,
     DeleteClientResponse,
+    LookupClientRequest,
+    LookupClientResponse,
     ManagedClientInfoList,
     connect_manager,
 )
+from lsp_cli.manager import manager as manager_module
+from lsp_cli.manager.client import ManagedClient
+from lsp_cli.manager.manager import Manager
 from lsp_cli.settings import MANAGER_UDS_PATH, RUNTIME_DIR
 from lsp_cli.utils.http import AsyncHttpClient, HttpClient
 from lsp_cli.utils.socket import is_socket_alive, wait_socket
@@ -56,7 +67,7 @@ def manager_process():
     # Cleanup
     proc.terminate()
     try:
-        proc.wait(timeout=5)
+        wait_process(proc, timeout=5)
     except subprocess.TimeoutExpired:
         proc.kill()
         proc.wait()
@@ -155,11 +166,59 @@ class TestClientLifecycle:
             )
             assert resp2 is not None
             assert resp2.uds_path == uds_path1
+            assert not resp2.created
 
             # Remaining time should be reset (approximately equal to full timeout)
             # Both should be close to the full idle_timeout
             assert resp2.info.remaining_time >= time1 - 1  # Allow 1 second variance
 
+    def test_lookup_running_client(self, manager_process, test_file):
+        """Test that looking up a path served by a running client finds it."""
+        with connect_manager() as client:
+            created = client.post(
+                "/create",
+                CreateClientResponse,
+                json=CreateClientRequest(path=test_file),
+            )
+            assert created is not None
+
+            found = client.get(
+                "/lookup",
+                LookupClientResponse,
+                params=LookupClientRequest(path=test_file),
+            )
+            assert found is not None
+            assert found.uds_path == created.uds_path
+            assert found.info.project_path == created.info.project_path
+
+            # The CLI helper returns the same client
+            helper_found = lookup_client(client, test_file)
+            assert helper_found is not None
+            assert helper_found.uds_path == found.uds_path
+
+    def test_lookup_without_client(self, manager_process, tmp_path):
+        """Test that looking up a path without a running client is a 404."""
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "demo"\n')
+        file = tmp_path / "main.py"
+        file.write_text("x = 1\n")
+
+        with connect_manager() as client:
+            with pytest.raises(httpx.HTTPStatusError) as exc_info:
+                client.get(
+                    "/lookup",
+                    LookupClientResponse,
+                    params=LookupClientRequest(path=file),
+                )
+            assert exc_info.value.response.status_code == 404
+
+            # The CLI helper reports the miss instead of raising
+            assert lookup_client(client, file) is None
+
+            # A miss does not start a client
+            listed = client.get("/list", ManagedClientInfoList)
+            assert listed is not None
+            assert all(info.project_path != tmp_path for info in listed.root)
+
     def test_delete_client(self, manager_process, test_file):
         """Test deleting a client."""
         with connect_manager() as client:
@@ -401,6 +460,69 @@ class TestAutoStartManager:
             resp = client.get("/list", ManagedClientInfoList)
             assert resp is not None
 
+    @pytest.mark.skipif(not Path("/proc/self/environ").exists(), reason="needs /proc")
+    def test_concurrent_commands_start_one_manager(self, tmp_path):
+        """Test that concurrent first commands share a single new manager."""
+        env = {**os.environ, "XDG_RUNTIME_DIR": str(tmp_path)}
+        procs = [
+            subprocess.Popen(
+                [sys.executable, "-m", "lsp_cli", "server", "list"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                env=env,
+            )
+            for _ in range(4)
+        ]
+        for proc in procs:
+            wait_process(proc, timeout=30)
+
+        managers = find_managers(tmp_path)
+        try:
+            assert len(managers) == 1, f"Started managers: {managers}"
+        finally:
+            for pid in managers:
+                os.kill(pid, signal.SIGTERM)
+
+
+class TestResolveMemo:
+    """Test the manager's memo of resolved paths."""
+
+    @pytest.fixture
+    def counted_find_client(self, monkeypatch, test_file):
+        """Count the project searches of the manager."""
+        target = find_client(test_file)
+        calls = []
+
+        def fake_find_client(path):
+            calls.append(path)
+            return target
+
+        monkeypatch.setattr(manager_module, "find_client", fake_find_client)
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_paths_without_client_are_resolved_again(
+        self, counted_find_client, test_file
+    ):
+        """A lookup miss is not memoized, nothing would invalidate it."""
+        manager = Manager()
+        assert await manager._resolve(test_file) is not None
+        assert await manager._resolve(test_file) is not None
+        assert len(counted_find_client) == 2
+
+    @pytest.mark.asyncio
+    async def test_paths_with_running_client_are_memoized(
+        self, counted_find_client, test_file
+    ):
+        """A path served by a running client is only resolved once."""
+        manager = Manager()
+        resolved = await manager._resolve(test_file)
+        assert resolved is not None
+        manager._clients[resolved[1]] = cast(ManagedClient, object())
+
+        assert await manager._resolve(test_file) == resolved
+        assert len(counted_find_client) == 1
+
 
 class TestErrorHandling:
     """Test error handling in server management."""
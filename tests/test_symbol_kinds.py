@@ -0,0 +1,59 @@
+"""Tests for symbol kind filters of the search and outline commands."""
+
+import json
+
+import pytest
+import typer
+from lsap.schema.models import SymbolKind
+
+from lsp_cli.cli.search import parse_kinds
+from lsp_cli.manager import FilteredOutlineRequest
+from lsp_cli.utils.response_cache import response_cache_key
+
+
+class TestParseKinds:
+    """Test parsing `--kind` values."""
+
+    def test_names_are_case_insensitive(self):
+        """Kinds can be given in any case."""
+        assert parse_kinds(["Class", "FUNCTION", "method"]) == [
+            SymbolKind.Class,
+            SymbolKind.Function,
+            SymbolKind.Method,
+        ]
+
+    def test_unknown_kind_is_rejected(self):
+        """An unknown kind is a usage error naming the kind and the option."""
+        with pytest.raises(typer.BadParameter) as exc_info:
+            parse_kinds(["class", "widget"])
+
+        assert "'widget'" in str(exc_info.value)
+        assert exc_info.value.param_hint == "'--kind'"
+
+
+class TestFilteredOutlineRequest:
+    """Test serializing outline requests, which keys their cached responses."""
+
+    def test_kinds_are_serialized_sorted(self, tmp_path):
+        """Equal kind sets serialize, and so are cached, identically."""
+        # All kinds, as a set of a few could iterate in sorted order by chance
+        kinds = list(SymbolKind)
+        requests = [
+            FilteredOutlineRequest(file_path=tmp_path, kinds=frozenset(order))
+            for order in (kinds, kinds[::-1])
+        ]
+        dumped = [req.model_dump_json() for req in requests]
+
+        assert json.loads(dumped[0])["kinds"] == sorted(kind.value for kind in kinds)
+        assert dumped[0] == dumped[1]
+
+        file = tmp_path / "main.py"
+        file.write_text("x = 1\n")
+        keys = {response_cache_key(file, "/capability/outline", d) for d in dumped}
+        assert len(keys) == 1
+
+    def test_no_kinds(self, tmp_path):
+        """Without kinds, every symbol is requested."""
+        req = FilteredOutlineRequest(file_path=tmp_path)
+
+        assert json.loads(req.model_dump_json())["kinds"] is None